@@ -0,0 +1,16 @@
+{
+    'name': 'Bulk Export',
+    'version': '18.0.1.0',
+    'summary': 'Streamed XLSX / CSV / JSONL export of any recordset',
+    'sequence': -100,
+    'description': """Shared export service: reads the records in chunks and streams the file to the browser without storing attachments.""",
+    'category': 'Technical',
+    'website': 'https://www.odoo.com',
+    'depends': ['base', 'web'],
+    'data': [
+        'security/ir.model.access.csv',
+    ],
+    'installable': True,
+    'application': False,
+    'license': 'LGPL-3',
+}
@@ -0,0 +1,28 @@
+from odoo import http
+from odoo.http import request
+from werkzeug.wsgi import wrap_file
+import tempfile
+
+
+class BulkExportController(http.Controller):
+
+    @http.route('/bulk_export/download/<int:job_id>', type='http', auth='user', methods=['GET'])
+    def download(self, job_id, **kw):
+        """Write the requested export to a temporary file and stream it."""
+        job = request.env['bulk.export.job'].browse(job_id).exists()
+        if not job or job.create_uid != request.env.user:
+            return request.not_found()
+
+        fileobj = tempfile.TemporaryFile()
+        job._write_export_file(fileobj)
+        size = fileobj.tell()
+        fileobj.seek(0)
+
+        headers = [
+            ('Content-Type', job._mimetype()),
+            ('Content-Length', size),
+            ('Content-Disposition', http.content_disposition(job.filename)),
+        ]
+        response = request.make_response(wrap_file(request.httprequest.environ, fileobj), headers=headers)
+        response.direct_passthrough = True
+        return response
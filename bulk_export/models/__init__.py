@@ -0,0 +1 @@
+from . import bulk_export_job
@@ -0,0 +1,141 @@
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+import csv
+import io
+import json
+import xlsxwriter
+
+
+class BulkExportJob(models.TransientModel):
+    """One export request: which records, which columns, which format.
+
+    Only the record ids and the column spec are stored; the file itself is
+    written to a temporary file when the download route is hit and streamed
+    from there, so no ``ir.attachment`` is created per click.
+    """
+    _name = 'bulk.export.job'
+    _description = 'Bulk Export Request'
+
+    # Records read per ``read()`` call while writing the file
+    _chunk_size = 2000
+
+    res_model = fields.Char(string="Model", required=True)
+    res_ids = fields.Text(string="Record IDs", required=True, help="JSON list of the exported record ids")
+    field_spec = fields.Text(string="Columns", required=True, help="JSON list of [field name, column header]")
+    file_format = fields.Selection([
+        ('xlsx', 'Excel'),
+        ('csv', 'CSV'),
+        ('jsonl', 'JSON Lines'),
+    ], string="Format", required=True, default='xlsx')
+    filename = fields.Char(string="File Name", required=True)
+
+    _mimetypes = {
+        'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+        'csv': 'text/csv',
+        'jsonl': 'application/x-ndjson',
+    }
+
+    @api.model
+    def _start(self, records, field_spec, file_format='xlsx', filename='export'):
+        """Return the download action exporting ``records`` with the columns
+        ``field_spec``, a list of ``(field name, header)`` pairs."""
+        if not records:
+            raise UserError("Please select at least one record to export.")
+        job = self.create({
+            'res_model': records._name,
+            'res_ids': json.dumps(records.ids),
+            'field_spec': json.dumps(field_spec),
+            'file_format': file_format,
+            'filename': f'{filename}.{file_format}',
+        })
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/bulk_export/download/{job.id}',
+            'target': 'new',
+        }
+
+    def _mimetype(self):
+        return self._mimetypes[self.file_format]
+
+    def _iter_rows(self):
+        """Yield ``(record values, fields)`` one record at a time, reading
+        ``_chunk_size`` records per query and clearing the cache in between."""
+        self.ensure_one()
+        Model = self.env[self.res_model]
+        field_names = [fname for fname, _header in json.loads(self.field_spec)]
+        ids = json.loads(self.res_ids)
+        for start in range(0, len(ids), self._chunk_size):
+            records = Model.browse(ids[start:start + self._chunk_size]).exists()
+            yield from records.read(field_names)
+            self.env.invalidate_all()
+
+    def _format_value(self, field, value, labels):
+        """Cell value of ``field`` for the XLSX and CSV formats."""
+        if field.type == 'many2one':
+            return value[1] if value else ''
+        if field.type in ('one2many', 'many2many'):
+            return len(value)
+        if field.type == 'selection':
+            return labels[field.name].get(value, '')
+        if field.type == 'boolean':
+            return 'Yes' if value else 'No'
+        if field.type == 'date':
+            return fields.Date.to_string(value) if value else ''
+        if field.type == 'datetime':
+            return fields.Datetime.to_string(value) if value else ''
+        return '' if value is False else value
+
+    def _json_value(self, field, value):
+        if field.type == 'many2one':
+            return value[1] if value else None
+        if field.type == 'date':
+            return fields.Date.to_string(value) if value else None
+        if field.type == 'datetime':
+            return fields.Datetime.to_string(value) if value else None
+        if value is False and field.type != 'boolean':
+            return None
+        return value
+
+    def _write_export_file(self, fileobj):
+        """Write the export into the binary file object ``fileobj``."""
+        self.ensure_one()
+        Model = self.env[self.res_model]
+        spec = json.loads(self.field_spec)
+        model_fields = [Model._fields[fname] for fname, _header in spec]
+        labels = {
+            field.name: dict(field._description_selection(self.env))
+            for field in model_fields if field.type == 'selection'
+        }
+
+        if self.file_format == 'jsonl':
+            for values in self._iter_rows():
+                line = {field.name: self._json_value(field, values[field.name]) for field in model_fields}
+                fileobj.write(json.dumps(line, default=str).encode() + b'\n')
+            return
+
+        if self.file_format == 'csv':
+            text = io.TextIOWrapper(fileobj, encoding='utf-8', newline='', write_through=True)
+            writer = csv.writer(text)
+            writer.writerow([header for _fname, header in spec])
+            for values in self._iter_rows():
+                writer.writerow([self._format_value(field, values[field.name], labels) for field in model_fields])
+            text.detach()
+            return
+
+        # Rows are flushed to disk as they are written (constant_memory), so
+        # the sheet must be filled strictly top to bottom
+        workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True})
+        header_format = workbook.add_format({
+            'bold': True, 'bg_color': '#D3D3D3', 'border': 1, 'align': 'center', 'valign': 'vcenter',
+        })
+        text_format = workbook.add_format({'border': 1})
+        sheet = workbook.add_worksheet(self.filename.rsplit('.', 1)[0][:31])
+        for col, (_fname, header) in enumerate(spec):
+            sheet.set_column(col, col, max(len(header) + 5, 15))
+        sheet.write_row(0, 0, [header for _fname, header in spec], header_format)
+        sheet.freeze_panes(1, 0)
+        for row, values in enumerate(self._iter_rows(), start=1):
+            sheet.write_row(
+                row, 0, [self._format_value(field, values[field.name], labels) for field in model_fields], text_format
+            )
+        workbook.close()
@@ -6,11 +6,16 @@
     'description': """Custom Sale Module for handling custom sales processes and workflows.""",
     'category': 'for study purpose',
     'website': 'https://www.odoo.com',
-    'depends': ['sale', 'account'],
+    'depends': ['sale', 'account', 'bulk_export'],
     'data': [
+        'security/security.xml',
+        'security/ir.model.access.csv',
         'data/user_details_mail.xml',
+        'data/cron_data.xml',
         'views/sale_order_view.xml',
         'views/account_move_view.xml',
+        'views/account_penalty_policy_views.xml',
+        'views/account_overdue_aging_views.xml',
         'views/invoice_report.xml',
         'reports/report_file.xml'
         
@@ -0,0 +1,18 @@
+from odoo import http
+from odoo.http import request
+
+
+class OverdueAgingController(http.Controller):
+
+    @http.route('/custom_sale/overdue_aging', type='http', auth='user', methods=['GET'])
+    def overdue_aging(self, limit=100, offset=0, **kw):
+        """Overdue exposure and accrued penalties of all customers as JSON."""
+        if not request.env.user.has_group('account.group_account_invoice'):
+            return request.not_found()
+        try:
+            limit = min(max(int(limit), 1), 1000)
+            offset = max(int(offset), 0)
+        except ValueError:
+            limit, offset = 100, 0
+        summary = request.env['account.overdue.aging']._get_summary(limit=limit, offset=offset)
+        return request.make_json_response(summary)
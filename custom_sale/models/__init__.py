@@ -1,2 +1,4 @@
 from . import sale_order
-from . import account_move
\ No newline at end of file
+from . import account_penalty_policy
+from . import account_move
+from . import account_overdue_aging
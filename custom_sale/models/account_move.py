@@ -1,5 +1,9 @@
 from odoo import models, fields, api
+from odoo.tools.sql import create_index
 from datetime import datetime, date
+import logging
+
+_logger = logging.getLogger(__name__)
 
 class AccountMove(models.Model):
     _inherit = "account.move"
@@ -7,12 +11,19 @@ class AccountMove(models.Model):
     payment_method = fields.Char(string="Payment Method")
     payment_info = fields.Char(string="Payment Information")
     
+    # Written by the nightly accrual (_accrue_penalties), not computed on read
     penalty_amount = fields.Monetary(
         string='Late Payment Penalty', 
-        compute='_compute_penalty_amount',
-        store=True,
+        readonly=True,
+        copy=False,
+        default=0.0,
         currency_field='currency_id'
     )
+    penalty_date = fields.Date(string='Penalty Accrued On', readonly=True, copy=False)
+    penalty_history_ids = fields.One2many('account.move.penalty.history', 'move_id', string='Penalty History')
+    penalty_line_id = fields.Many2one('account.move.line', string='Penalty Line',
+                                      compute='_compute_penalty_line_id', store=True,
+                                      help="Invoice line whose total carries the penalty")
     
     amount_residual_with_penalty = fields.Monetary(
         string='Amount Due (with Penalty)',
@@ -21,31 +32,158 @@ class AccountMove(models.Model):
         currency_field='currency_id'
     )
 
-    @api.depends('invoice_date_due', 'amount_total', 'state', 'payment_state', 'amount_residual')
-    def _compute_penalty_amount(self):
-        for record in self:
-            penalty_amount = 0.0
+    _penalty_move_types = ('out_invoice', 'in_invoice', 'out_receipt', 'in_receipt')
+    _penalty_chunk_size = 1000
 
-            if (record.state == 'posted' and 
-                record.move_type in ['out_invoice', 'in_invoice', 'out_receipt', 'in_receipt'] and
-                record.payment_state in ['not_paid', 'partial'] and
-                record.amount_residual > 0 and
-                record.invoice_date_due):
+    def init(self):
+        super().init()
+        # Overdue lookup of the accrual cron, and the moves still carrying a penalty
+        create_index(self.env.cr, 'account_move_penalty_overdue_index', self._table,
+                     ['payment_state', 'invoice_date_due'], where="state = 'posted'")
+        create_index(self.env.cr, 'account_move_penalty_accrued_index', self._table,
+                     ['id'], where="penalty_amount <> 0")
 
-                today = date.today()
-                due_date = record.invoice_date_due
+    @api.depends('invoice_line_ids.display_type')
+    def _compute_penalty_line_id(self):
+        # Chosen once per move instead of once per line in _compute_totals
+        field = self._fields['penalty_line_id']
+        old_line_ids = {}
+        unknown = []
+        for move in self:
+            if self.env.cache.contains(move, field):
+                old_line_ids[move.id] = self.env.cache.get(move, field)
+            elif move.id:
+                unknown.append(move.id)
+        if unknown:
+            # Not loaded yet: the stored value is the line currently carrying the penalty
+            self.env.cr.execute("SELECT id, penalty_line_id FROM account_move WHERE id IN %s", [tuple(unknown)])
+            old_line_ids.update(self.env.cr.fetchall())
+
+        changed_ids = []
+        for move in self:
+            new_line = next(
+                (line for line in move.invoice_line_ids if line.display_type in ('product', 'cogs')),
+                self.env['account.move.line'],
+            )
+            old_line_id = old_line_ids.get(move.id)
+            if old_line_id != new_line.id:
+                # Only the previous and the new penalty line get new totals
+                changed_ids += [line_id for line_id in (old_line_id, new_line.id)
+                                if line_id and line_id in move.invoice_line_ids._ids]
+            move.penalty_line_id = new_line
+        if changed_ids:
+            lines = self.env['account.move.line'].browse(changed_ids)
+            self.env.add_to_compute(lines._fields['price_subtotal'], lines)
+            self.env.add_to_compute(lines._fields['price_total'], lines)
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'penalty_amount' in vals:
+            # Only the penalty lines need new totals, not every line of the moves
+            lines = self.penalty_line_id
+            self.env.add_to_compute(lines._fields['price_subtotal'], lines)
+            self.env.add_to_compute(lines._fields['price_total'], lines)
+        return res
+
+    @api.model
+    def _cron_accrue_penalties(self):
+        """Daily cron: bring the penalty of every overdue invoice up to date."""
+        count = self._accrue_penalties(auto_commit=True)
+        self.env['account.overdue.aging']._refresh()
+        return count
+
+    @api.model
+    def _accrue_penalties(self, moves=None, auto_commit=False):
+        """Recompute the penalties of ``moves`` (all invoices when ``None``).
+
+        Overdue posted invoices, and moves that still carry a penalty but
+        are no longer overdue, are selected with one indexed query.  The
+        new amounts are computed for the whole batch at once and written
+        chunk by chunk together with their history rows; unchanged
+        penalties are not rewritten.  Returns the number of moves updated.
+        """
+        if moves is not None and not moves:
+            return 0
+        today = fields.Date.context_today(self)
+        self.flush_model([
+            'state', 'move_type', 'payment_state', 'invoice_date_due', 'amount_total',
+            'amount_residual', 'penalty_amount', 'company_id', 'currency_id',
+        ])
+        move_clause = "AND id IN %(move_ids)s" if moves is not None else ""
+        self.env.cr.execute(f"""
+            SELECT id, company_id, currency_id, invoice_date_due, amount_residual,
+                   COALESCE(penalty_amount, 0) AS penalty_amount,
+                   amount_total - COALESCE(penalty_amount, 0) AS amount_total,
+                   state = 'posted'
+                   AND payment_state IN ('not_paid', 'partial')
+                   AND move_type IN %(move_types)s
+                   AND amount_residual > 0
+                   AND invoice_date_due < %(today)s AS overdue
+              FROM account_move
+             WHERE ((state = 'posted'
+                     AND payment_state IN ('not_paid', 'partial')
+                     AND invoice_date_due < %(today)s)
+                    OR penalty_amount <> 0)
+               {move_clause}
+        """, {
+            'today': today,
+            'move_types': self._penalty_move_types,
+            'move_ids': tuple(moves.ids) if moves is not None else (),
+        })
+        rows = self.env.cr.dictfetchall()
 
-                if today > due_date:
-                    days_overdue = (today - due_date).days
+        penalties = self._compute_penalties(rows, today)
+        currencies = {currency.id: currency for currency in self.env['res.currency'].browse(
+            {row['currency_id'] for row in rows}
+        )}
+        updates = []
+        for row, (days, penalty) in zip(rows, penalties):
+            penalty = currencies[row['currency_id']].round(penalty)
+            if penalty != row['penalty_amount']:
+                updates.append((row['id'], days, penalty))
 
-                    # Daily compounding at 5%
-                    daily_penalty_rate = 0.05  # 5%
-                    base_amount = record.amount_total  # Penalty on total (incl. tax)
+        # The history is bookkeeping of the accrual, not a user action
+        History = self.env['account.move.penalty.history'].sudo()
+        for start in range(0, len(updates), self._penalty_chunk_size):
+            chunk = updates[start:start + self._penalty_chunk_size]
+            # One write per distinct amount rather than per invoice and field
+            ids_by_penalty = {}
+            for move_id, _days, penalty in chunk:
+                ids_by_penalty.setdefault(penalty, []).append(move_id)
+            for penalty, move_ids in ids_by_penalty.items():
+                self.browse(move_ids).write({'penalty_amount': penalty, 'penalty_date': today})
+            History.create([{
+                'move_id': move_id,
+                'date': today,
+                'days_overdue': days,
+                'penalty_amount': penalty,
+            } for move_id, days, penalty in chunk])
+            # Dependent totals are recomputed once for the whole chunk
+            self.env.flush_all()
+            if auto_commit:
+                self.env.cr.commit()
+                self.env.invalidate_all()
+        _logger.info("Penalty accrual: %s of %s moves updated", len(updates), len(rows))
+        return len(updates)
 
-                    compounded_total = base_amount * ((1 + daily_penalty_rate) ** days_overdue)
-                    penalty_amount = compounded_total - base_amount
+    @api.model
+    def _compute_penalties(self, rows, today):
+        """Return ``(days_overdue, penalty)`` for each accrual row, in order.
 
-            record.penalty_amount = penalty_amount
+        The penalty policy of each company is turned into a rate table once,
+        then applied to every row with a lookup, so the result only depends
+        on the policy, the due date and the base amount.
+        """
+        tables = self.env['account.penalty.policy']._get_tables({row['company_id'] for row in rows})
+        result = []
+        for row in rows:
+            if not row['overdue']:
+                result.append((0, 0.0))
+                continue
+            days_overdue = (today - row['invoice_date_due']).days
+            table = tables.get(row['company_id'], tables[False])
+            result.append((days_overdue, table.penalty(days_overdue, row['amount_total'], row['amount_residual'])))
+        return result
             
             
     @api.depends('amount_residual', 'penalty_amount', 'payment_state')
@@ -83,13 +221,12 @@ class AccountMove(models.Model):
     
     # Override the payment registration to consider penalty
     def action_register_payment(self):
-        self._compute_penalty_amount()
+        self._accrue_penalties(self)
         return super().action_register_payment()
     
     # Method to manually recalculate penalty (can be called from button)
     def recalculate_penalty(self):
-        self._compute_penalty_amount()
-        self._compute_amount_residual_with_penalty()
+        self._accrue_penalties(self)
         return True
 
     # Ensure PDF/Widget totals include penalty as well
@@ -118,20 +255,23 @@ class AccountMove(models.Model):
     # Method to check payment status details
     def get_payment_status_details(self):
         """
-        Returns detailed payment status information
+        Returns detailed payment status information; see account.overdue.aging
+        for the figures of all customers
         """
-        for record in self:
-            return {
-                'is_paid': record.payment_state == 'paid',
-                'is_partial': record.payment_state == 'partial',
-                'is_unpaid': record.payment_state == 'not_paid',
-                'is_in_payment': record.payment_state == 'in_payment',
-                'amount_paid': record.amount_total - record.amount_residual,
-                'amount_remaining': record.amount_residual,
-                'is_overdue': record.invoice_date_due and record.invoice_date_due < date.today(),
-                'days_overdue': (date.today() - record.invoice_date_due).days if record.invoice_date_due and record.invoice_date_due < date.today() else 0,
-                'penalty_amount': record.penalty_amount,
-            }
+        self.ensure_one()
+        today = date.today()
+        is_overdue = bool(self.invoice_date_due and self.invoice_date_due < today)
+        return {
+            'is_paid': self.payment_state == 'paid',
+            'is_partial': self.payment_state == 'partial',
+            'is_unpaid': self.payment_state == 'not_paid',
+            'is_in_payment': self.payment_state == 'in_payment',
+            'amount_paid': self.amount_total - self.amount_residual,
+            'amount_remaining': self.amount_residual,
+            'is_overdue': is_overdue,
+            'days_overdue': (today - self.invoice_date_due).days if is_overdue else 0,
+            'penalty_amount': self.penalty_amount,
+        }
     
     # Override payment methods to handle penalty
     def _get_reconciled_info_JSON_values(self):
@@ -154,29 +294,30 @@ class AccountMove(models.Model):
         return super().action_post_payment() if hasattr(super(), 'action_post_payment') else True
 
 
+class AccountMovePenaltyHistory(models.Model):
+    _name = "account.move.penalty.history"
+    _description = "Late Payment Penalty History"
+    _order = "date desc, id desc"
+
+    move_id = fields.Many2one('account.move', string='Invoice', required=True, ondelete='cascade', index=True)
+    partner_id = fields.Many2one(related='move_id.partner_id', store=True, string='Partner')
+    currency_id = fields.Many2one(related='move_id.currency_id', string='Currency')
+    date = fields.Date(string='Date', required=True)
+    days_overdue = fields.Integer(string='Days Overdue')
+    penalty_amount = fields.Monetary(string='Penalty', currency_field='currency_id')
+
+
 class AccountMoveLine(models.Model):
     _inherit = "account.move.line"
 
-    @api.depends('quantity', 'discount', 'price_unit', 'tax_ids', 'currency_id', 'move_id.penalty_amount')
+    @api.depends('quantity', 'discount', 'price_unit', 'tax_ids', 'currency_id')
     def _compute_totals(self):
         """
         Compute 'price_subtotal' / 'price_total' and include penalty_amount on the total
+        of the move's penalty line only
         """
-        AccountTax = self.env['account.tax']
+        super()._compute_totals()
         for line in self:
-            # Skip non-product / non-cogs lines
-            if line.display_type not in ('product', 'cogs'):
-                line.price_total = line.price_subtotal = False
-                continue
-
-            # Base line for tax computation
-            base_line = line.move_id._prepare_product_base_line_for_taxes_computation(line)
-            AccountTax._add_tax_details_in_base_line(base_line, line.company_id)
-
-            # Regular totals
-            line.price_subtotal = base_line['tax_details']['raw_total_excluded_currency']
-            line.price_total = base_line['tax_details']['raw_total_included_currency']
-
-            # Add penalty only once per invoice (we can add to the first product line)
-            if line.move_id.penalty_amount > 0 and line == line.move_id.invoice_line_ids.filtered(lambda l: l.display_type in ('product', 'cogs'))[0]:
-                line.price_total += line.move_id.penalty_amount
+            move = line.move_id
+            if move.penalty_amount > 0 and move.penalty_line_id == line:
+                line.price_total += move.penalty_amount
@@ -0,0 +1,132 @@
+from odoo import models, fields, api
+from odoo.tools import drop_view_if_exists
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class AccountOverdueAging(models.Model):
+    """Open customer receivables per partner, split in overdue buckets.
+
+    Backed by a materialized view refreshed by a cron (and after each
+    penalty accrual), so the report never scans invoices when it is read.
+    Amounts are in company currency.
+    """
+    _name = 'account.overdue.aging'
+    _description = 'Overdue Aging per Customer'
+    _auto = False
+    _order = 'amount_overdue desc, id'
+    _rec_name = 'partner_id'
+
+    partner_id = fields.Many2one('res.partner', string='Customer', readonly=True)
+    company_id = fields.Many2one('res.company', string='Company', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency', readonly=True)
+    invoice_count = fields.Integer(string='Open Invoices', readonly=True)
+    overdue_count = fields.Integer(string='Overdue Invoices', readonly=True)
+    amount_due = fields.Monetary(string='Total Due', readonly=True)
+    amount_not_due = fields.Monetary(string='Not Due', readonly=True)
+    amount_overdue = fields.Monetary(string='Overdue', readonly=True)
+    amount_0_30 = fields.Monetary(string='0-30 Days', readonly=True)
+    amount_31_60 = fields.Monetary(string='31-60 Days', readonly=True)
+    amount_61_90 = fields.Monetary(string='61-90 Days', readonly=True)
+    amount_90_plus = fields.Monetary(string='90+ Days', readonly=True)
+    penalty_amount = fields.Monetary(string='Accrued Penalties', readonly=True)
+    max_days_overdue = fields.Integer(string='Max Days Overdue', readonly=True)
+    oldest_due_date = fields.Date(string='Oldest Due Date', readonly=True)
+    refresh_date = fields.Datetime(string='Refreshed On', readonly=True)
+
+    def _query(self):
+        return """
+            SELECT MIN(m.id) AS id,
+                   m.commercial_partner_id AS partner_id,
+                   m.company_id,
+                   c.currency_id,
+                   COUNT(*) AS invoice_count,
+                   COUNT(*) FILTER (WHERE m.invoice_date_due < CURRENT_DATE) AS overdue_count,
+                   SUM(m.amount_residual_signed) AS amount_due,
+                   COALESCE(SUM(m.amount_residual_signed)
+                            FILTER (WHERE m.invoice_date_due IS NULL OR m.invoice_date_due >= CURRENT_DATE), 0)
+                       AS amount_not_due,
+                   COALESCE(SUM(m.amount_residual_signed) FILTER (WHERE m.invoice_date_due < CURRENT_DATE), 0)
+                       AS amount_overdue,
+                   COALESCE(SUM(m.amount_residual_signed)
+                            FILTER (WHERE CURRENT_DATE - m.invoice_date_due BETWEEN 1 AND 30), 0) AS amount_0_30,
+                   COALESCE(SUM(m.amount_residual_signed)
+                            FILTER (WHERE CURRENT_DATE - m.invoice_date_due BETWEEN 31 AND 60), 0) AS amount_31_60,
+                   COALESCE(SUM(m.amount_residual_signed)
+                            FILTER (WHERE CURRENT_DATE - m.invoice_date_due BETWEEN 61 AND 90), 0) AS amount_61_90,
+                   COALESCE(SUM(m.amount_residual_signed)
+                            FILTER (WHERE CURRENT_DATE - m.invoice_date_due > 90), 0) AS amount_90_plus,
+                   -- penalties are kept in invoice currency
+                   COALESCE(SUM(m.penalty_amount * m.amount_residual_signed / NULLIF(m.amount_residual, 0)), 0)
+                       AS penalty_amount,
+                   COALESCE(MAX(CURRENT_DATE - m.invoice_date_due), 0) AS max_days_overdue,
+                   MIN(m.invoice_date_due) AS oldest_due_date,
+                   NOW() AT TIME ZONE 'UTC' AS refresh_date
+              FROM account_move m
+              JOIN res_company c ON c.id = m.company_id
+             WHERE m.state = 'posted'
+               AND m.payment_state IN ('not_paid', 'partial')
+               AND m.move_type IN ('out_invoice', 'out_receipt')
+               AND m.amount_residual > 0
+          GROUP BY m.commercial_partner_id, m.company_id, c.currency_id
+        """
+
+    def init(self):
+        # Drops the plain or materialized view, whichever exists
+        drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(f"CREATE MATERIALIZED VIEW {self._table} AS ({self._query()})")
+        # The unique index allows concurrent refreshes
+        self.env.cr.execute(f"CREATE UNIQUE INDEX {self._table}_id_index ON {self._table} (id)")
+        self.env.cr.execute(f"CREATE INDEX {self._table}_partner_index ON {self._table} (partner_id, company_id)")
+        self.env.cr.execute(f"CREATE INDEX {self._table}_overdue_index ON {self._table} (amount_overdue DESC)")
+
+    @api.model
+    def _refresh(self):
+        """Rebuild the aging figures; readers keep the previous data meanwhile."""
+        self.env['account.move'].flush_model()
+        self.env.cr.execute(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {self._table}")
+        self.invalidate_model()
+        _logger.info("Overdue aging refreshed")
+        return True
+
+    @api.model
+    def _get_summary(self, limit=100, offset=0):
+        """Totals over all customers and the most exposed customers, as plain data."""
+        totals_fields = [
+            'amount_due', 'amount_not_due', 'amount_overdue', 'amount_0_30', 'amount_31_60',
+            'amount_61_90', 'amount_90_plus', 'penalty_amount', 'invoice_count', 'overdue_count',
+        ]
+        groups = self._read_group(
+            [], ['company_id', 'currency_id'], [f'{fname}:sum' for fname in totals_fields] + ['refresh_date:max']
+        )
+        rows = self.search_read(
+            [('amount_overdue', '>', 0)],
+            ['partner_id', 'company_id', 'currency_id', 'overdue_count', 'amount_overdue', 'amount_0_30',
+             'amount_31_60', 'amount_61_90', 'amount_90_plus', 'penalty_amount', 'max_days_overdue',
+             'oldest_due_date'],
+            limit=limit, offset=offset,
+        )
+        return {
+            'totals': [{
+                'company': company.name,
+                'currency': currency.name,
+                'refresh_date': fields.Datetime.to_string(values[-1]),
+                **dict(zip(totals_fields, values[:-1])),
+            } for company, currency, *values in groups],
+            'customers': [{
+                'partner_id': row['partner_id'][0] if row['partner_id'] else False,
+                'partner': row['partner_id'][1] if row['partner_id'] else '',
+                'company': row['company_id'][1] if row['company_id'] else '',
+                'currency': row['currency_id'][1] if row['currency_id'] else '',
+                'overdue_count': row['overdue_count'],
+                'amount_overdue': row['amount_overdue'],
+                'amount_0_30': row['amount_0_30'],
+                'amount_31_60': row['amount_31_60'],
+                'amount_61_90': row['amount_61_90'],
+                'amount_90_plus': row['amount_90_plus'],
+                'penalty_amount': row['penalty_amount'],
+                'max_days_overdue': row['max_days_overdue'],
+                'oldest_due_date': fields.Date.to_string(row['oldest_due_date']),
+            } for row in rows],
+        }
@@ -0,0 +1,101 @@
+from odoo import models, fields, api
+
+
+class PenaltyTable:
+    """Penalty factors of one policy, indexed by elapsed compounding periods.
+
+    The compounded factors are built once, up to the period where the cap
+    is reached; later periods reuse the capped factor.  Applying a policy to
+    a recordset is then one table lookup per invoice, without evaluating a
+    power that could overflow.
+    """
+
+    # Upper bound of the table when the cap is never reached (100 years daily)
+    _max_periods = 36500
+
+    def __init__(self, rate, period_days, grace_days, cap, base):
+        self.period_days = max(period_days, 1)
+        self.grace_days = max(grace_days, 0)
+        self.base = base
+        factors = [0.0]
+        growth = 1.0
+        while rate > 0 and factors[-1] < cap and len(factors) <= self._max_periods:
+            growth *= 1 + rate
+            factors.append(min(growth - 1, cap))
+        self._factors = factors
+
+    def factor(self, days_overdue):
+        if days_overdue <= self.grace_days:
+            return 0.0
+        periods = (days_overdue - self.grace_days) // self.period_days
+        return self._factors[min(periods, len(self._factors) - 1)]
+
+    def penalty(self, days_overdue, amount_total, amount_residual):
+        base_amount = amount_residual if self.base == 'residual' else amount_total
+        return base_amount * self.factor(days_overdue)
+
+
+class AccountPenaltyPolicy(models.Model):
+    _name = 'account.penalty.policy'
+    _description = 'Late Payment Penalty Policy'
+    _order = 'sequence, id'
+
+    # Policy used when a company has none: 5% compounded daily, capped at the base amount
+    _default_rate = 5.0
+    _default_period_days = 1
+    _default_grace_days = 0
+    _default_cap = 100.0
+    _default_base = 'total'
+
+    name = fields.Char(string='Name', required=True)
+    sequence = fields.Integer(default=10)
+    active = fields.Boolean(default=True)
+    company_id = fields.Many2one('res.company', string='Company', default=lambda self: self.env.company,
+                                 help="Leave empty to apply to every company without its own policy")
+    rate = fields.Float(string='Rate (%)', required=True, default=5.0, digits=(16, 4),
+                        help="Interest added per compounding period")
+    period_days = fields.Integer(string='Compounding Period (Days)', required=True, default=1)
+    grace_days = fields.Integer(string='Grace Days', default=0,
+                                help="Days after the due date before the penalty starts")
+    cap = fields.Float(string='Cap (%)', required=True, default=100.0,
+                       help="Maximum penalty as a percentage of the base amount")
+    base = fields.Selection([
+        ('residual', 'Amount Due'),
+        ('total', 'Invoice Total'),
+    ], string='Penalty Base', required=True, default='total')
+
+    _sql_constraints = [
+        ('rate_positive', 'CHECK(rate >= 0)', 'The penalty rate cannot be negative.'),
+        ('period_positive', 'CHECK(period_days >= 1)', 'The compounding period must be at least one day.'),
+        ('grace_positive', 'CHECK(grace_days >= 0)', 'Grace days cannot be negative.'),
+        ('cap_range', 'CHECK(cap > 0 AND cap <= 1000)', 'The cap must be between 0 and 1000%.'),
+    ]
+
+    @api.model
+    def _get_tables(self, company_ids):
+        """Return ``{company_id: PenaltyTable}`` for ``company_ids`` using one search.
+
+        A company policy wins over a generic one; without any, the built-in
+        default policy applies.  The key ``False`` holds the fallback table.
+        """
+        by_company = {}
+        generic = None
+        for policy in self.search([]):
+            if policy.company_id:
+                by_company.setdefault(policy.company_id.id, policy)
+            elif generic is None:
+                generic = policy
+
+        default_table = generic._make_table() if generic else PenaltyTable(
+            self._default_rate / 100.0, self._default_period_days, self._default_grace_days,
+            self._default_cap / 100.0, self._default_base,
+        )
+        tables = {False: default_table}
+        for company_id in company_ids:
+            policy = by_company.get(company_id)
+            tables[company_id] = policy._make_table() if policy else default_table
+        return tables
+
+    def _make_table(self):
+        self.ensure_one()
+        return PenaltyTable(self.rate / 100.0, self.period_days, self.grace_days, self.cap / 100.0, self.base)
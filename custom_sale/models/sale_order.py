@@ -1,7 +1,10 @@
 from odoo import models, fields, api
-import base64
-import io
-from openpyxl import Workbook
+from odoo.exceptions import UserError
+import hashlib
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
 
 
 class SaleOrder(models.Model):
@@ -37,54 +40,26 @@ class SaleOrder(models.Model):
         invoice_vals['payment_info'] = self.payment_info
         return invoice_vals
     
+    # Columns of the order line export: (sale.order.line field, header)
+    _export_field_spec = [
+        ('order_id', 'Order'),
+        ('order_partner_id', 'Customer'),
+        ('product_id', 'Product'),
+        ('product_uom_qty', 'Quantity'),
+        ('price_unit', 'Unit Price'),
+        ('price_subtotal', 'Subtotal'),
+    ]
+
     def action_export_excel(self):
-        """Export current sale order details to Excel"""
-        for order in self:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "Sales Order"
-
-            # Header
-            headers = ["Order", "Customer", "Product", "Quantity", "Unit Price", "Subtotal"]
-            ws.append(headers)
-
-            # Add order lines
-            for line in order.order_line:
-                ws.append([
-                    order.name,
-                    order.partner_id.name,
-                    line.product_id.display_name,
-                    line.product_uom_qty,
-                    line.price_unit,
-                    line.price_subtotal
-                ])
-
-            # Adjust column widths
-            column_widths = {
-                "A": 15, "B": 25, "C": 40, "D": 12, "E": 15, "F": 15,
-            }
-            for col, width in column_widths.items():
-                ws.column_dimensions[col].width = width
-
-            fp = io.BytesIO()
-            wb.save(fp)
-            excel_file = base64.b64encode(fp.getvalue())
-            fp.close()
-
-            attachment = self.env['ir.attachment'].create({
-                'name': f'{order.name}.xlsx',
-                'type': 'binary',
-                'datas': excel_file,
-                'res_model': 'sale.order',
-                'res_id': order.id,
-                'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            })
+        """Export the lines of all selected sale orders to one Excel file"""
+        lines = self.env['sale.order.line'].search(
+            [('order_id', 'in', self.ids), ('display_type', '=', False)], order='order_id, sequence, id'
+        )
+        return self.env['bulk.export.job']._start(lines, self._export_field_spec, 'xlsx', 'Sales_Orders')
 
-            return {
-                'type': 'ir.actions.act_url',
-                'url': f'/web/content/{attachment.id}?download=true',
-                'target': 'self',
-            }
+    # Report attached to quotation emails, cached per version of the order
+    _quotation_report = "custom_sale.action_report_custom_quotation"
+    _quotation_report_prefix = "Custom Quotation Report"
 
     def action_quotation_send(self):
         """
@@ -94,6 +69,9 @@ class SaleOrder(models.Model):
         action = super().action_quotation_send()
         ctx = dict(action.get("context", {}))
         custom_attachments = self._generate_custom_attachments()
+        report = self.env.ref(self._quotation_report, raise_if_not_found=False)
+        if report and len(custom_attachments) < len(self):
+            raise UserError("The quotation PDF could not be generated; see the server log for details.")
 
         if custom_attachments:
             ctx.update({
@@ -107,46 +85,140 @@ class SaleOrder(models.Model):
         action["context"] = ctx
         return action
 
+    def action_quotation_send_batch(self):
+        """Email the quotation of every selected order with its cached PDF.
+
+        Missing PDFs are rendered together in one report call; the emails are
+        left to the mail queue instead of being sent one by one.
+        """
+        attachments = self._get_quotation_attachments()
+        Composer = self.env['mail.compose.message'].with_context(
+            mark_so_as_sent=True, mail_notify_force_send=False,
+        )
+        # Without the report configured the quotations go out without PDF
+        report = self.env.ref(self._quotation_report, raise_if_not_found=False)
+        sent = self.filtered(lambda order: order.id in attachments) if report else self
+        for order in sent:
+            template = order._find_mail_template()
+            Composer.create({
+                'composition_mode': 'comment',
+                'model': order._name,
+                'res_ids': order.ids,
+                'template_id': template.id if template else False,
+                'attachment_ids': [(6, 0, attachments[order.id].ids if order.id in attachments else [])],
+            })._action_send_mail()
+
+        failed = self - sent
+        message = f'{len(sent)} quotations queued for sending.'
+        if failed:
+            message += f" Not sent, the PDF could not be generated: {', '.join(failed.mapped('name'))}."
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Quotations Sent',
+                'message': message,
+                'type': 'warning' if failed else 'success',
+                'sticky': bool(failed),
+            }
+        }
+
     def _generate_custom_attachments(self):
         """Generates multiple custom PDF reports for Sales Order (Odoo 18)."""
         if not self:
             return []
-            
-        record = self[0] 
-        attachments = []
-
-        # Report 1: Custom Quotation Report
-        att1 = self._generate_single_report(
-            record, 
-            "custom_sale.action_report_custom_quotation",
-            "Custom Quotation Report"
-        )
-        if att1:
-            attachments.append(att1)
+        attachments = self._get_quotation_attachments()
+        return [attachments[order.id] for order in self if order.id in attachments]
 
-        return attachments
+    def _quotation_cache_keys(self):
+        """``{order_id: key}``, a hash of the values printed on the quotation.
 
-    def _generate_single_report(self, record, report_ref, report_prefix):
-        """Helper method to generate a single report attachment (Odoo 18)."""
-        try:
-            report = self.env.ref(report_ref, raise_if_not_found=False)
-            if not report:
-                return None
+        Partner, company, product and tax data are included, so editing any
+        of them gives a new key even though the order itself is unchanged.
+        The related records are read in batch through the prefetch.
+        """
+        template = self.env.ref('custom_sale.report_custom_quotation_document', raise_if_not_found=False)
+        layout = [str(template.sudo().write_date) if template else None]
 
-            pdf_content, _ = report._render_qweb_pdf(
-                report.report_name, 
-                res_ids=[record.id]
-            )
+        def partner_values(partner):
+            return [partner.display_name, partner.street, partner.street2, partner.zip, partner.city,
+                    partner.state_id.name, partner.country_id.name, partner.vat, partner.phone, partner.email]
+
+        keys = {}
+        for order in self:
+            company = order.company_id
+            content = layout + [
+                order.id, order.name, order.state, order.date_order, order.validity_date, order.note,
+                order.client_order_ref, order.currency_id.name, order.pricelist_id.name,
+                order.payment_term_id.name, order.user_id.name,
+                order.amount_untaxed, order.amount_tax, order.amount_total,
+                partner_values(order.partner_id), partner_values(order.partner_invoice_id),
+                partner_values(order.partner_shipping_id),
+                partner_values(company.partner_id), company.name, company.report_header, company.report_footer,
+                company.company_details, str(company.write_date), company.external_report_layout_id.key,
+                [(line.id, line.display_type, line.name, line.product_id.display_name, line.product_id.default_code,
+                  line.product_uom_qty, line.product_uom.name, line.price_unit, line.discount,
+                  line.tax_id.mapped('name'), line.price_subtotal, line.price_total)
+                 for line in order.order_line],
+            ]
+            keys[order.id] = hashlib.sha1(json.dumps(content, default=str).encode()).hexdigest()
+        return keys
+
+    def _get_quotation_attachments(self):
+        """Current quotation PDF of each order as ``{order_id: attachment}``.
+
+        A PDF is reused as long as nothing it prints changed; the missing
+        ones are rendered in a single report call.  Orders whose PDF could
+        not be rendered are left out.  Outdated PDFs are kept since they may
+        be attached to emails already sent.
+        """
+        if not self:
+            return {}
+        keys = self._quotation_cache_keys()
+        cached = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_id', 'in', self.ids),
+            ('description', 'in', [f"quotation:{key}" for key in keys.values()]),
+        ])
+        attachments = {att.res_id: att for att in cached}
+        missing = self.filtered(lambda order: order.id not in attachments)
+        if missing:
+            attachments.update(missing._render_quotation_attachments(keys))
+        return attachments
 
-            attachment = self.env["ir.attachment"].create({
-                "name": f"{report_prefix} - {record.name}.pdf",
+    def _render_quotation_attachments(self, keys):
+        """Render these orders with one wkhtmltopdf call and store one attachment each."""
+        Report = self.env['ir.actions.report'].sudo()
+        report = self.env.ref(self._quotation_report, raise_if_not_found=False)
+        if not report:
+            return {}
+        try:
+            streams = Report._render_qweb_pdf_prepare_streams(report.report_name, None, res_ids=self.ids)
+        except Exception:
+            _logger.exception("Could not render the quotations of %s in one call", self.ids)
+            streams = {False: None}
+        if False in streams:
+            # The batch failed or could not be split per order: one call each,
+            # leaving out (and logging) the orders that cannot be rendered
+            streams = {}
+            for order in self:
+                try:
+                    streams.update(Report._render_qweb_pdf_prepare_streams(report.report_name, None, res_ids=order.ids))
+                except Exception:
+                    _logger.exception("Could not render the quotation of %s", order.name)
+
+        vals_list = []
+        for order in self.filtered(lambda order: order.id in streams):
+            stream = streams[order.id]['stream']
+            vals_list.append({
+                "name": f"{self._quotation_report_prefix} - {order.name}.pdf",
+                "description": f"quotation:{keys[order.id]}",
                 "type": "binary",
-                "datas": base64.b64encode(pdf_content),
-                "res_model": "sale.order",
-                "res_id": record.id,
+                "raw": stream.getvalue(),
+                "res_model": self._name,
+                "res_id": order.id,
                 "mimetype": "application/pdf",
             })
-            return attachment
-
-        except Exception:
-            return None
+            stream.close()
+        attachments = self.env["ir.attachment"].sudo().create(vals_list)
+        return {att.res_id: att for att in attachments}
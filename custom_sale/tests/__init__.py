@@ -0,0 +1 @@
+from . import test_penalty_accrual
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from odoo import fields
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+from odoo.tests import tagged
+from odoo.tests.common import new_test_user
+
+
+@tagged('post_install', '-at_install')
+class TestPenaltyAccrual(AccountTestInvoicingCommon):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.billing_user = new_test_user(
+            cls.env, login='penalty_billing', groups='base.group_user,account.group_account_invoice',
+            company_id=cls.env.company.id, company_ids=[(6, 0, cls.env.company.ids)],
+        )
+        overdue_date = fields.Date.today() - timedelta(days=10)
+        cls.invoice = cls.init_invoice('out_invoice', invoice_date=overdue_date, amounts=[100.0], post=True)
+        cls.invoice.invoice_date_due = overdue_date
+
+    def test_register_payment_as_billing_user(self):
+        invoice = self.invoice.with_user(self.billing_user)
+        self.assertFalse(self.billing_user.has_group('account.group_account_manager'))
+
+        invoice.action_register_payment()
+
+        self.assertGreater(self.invoice.penalty_amount, 0.0)
+        self.assertEqual(len(self.invoice.penalty_history_ids), 1)
+
+        self.env['account.payment.register'].with_user(self.billing_user).with_context(
+            active_model='account.move', active_ids=self.invoice.ids,
+        ).create({})._create_payments()
+        self.assertIn(self.invoice.payment_state, ('paid', 'in_payment', 'partial'))
+
+    def test_accrue_empty_recordset(self):
+        self.assertEqual(self.env['account.move']._accrue_penalties(self.env['account.move']), 0)
+        self.assertFalse(self.invoice.penalty_amount)
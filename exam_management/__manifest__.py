@@ -11,7 +11,7 @@
     """,
     'category': 'Education',
     'website': 'https://www.odoo.com',
-    'depends': ['base', 'mail', 'web', 'portal', 'website'],
+    'depends': ['base', 'mail', 'web', 'portal', 'website', 'bulk_export'],
     'data': [
         'security/exam_security.xml',
         'security/ir.model.access.csv',
@@ -23,14 +23,17 @@
         'wizard/exam_assignment_wizard_view.xml',
         'views/student_portal_dashboard.xml',
         'wizard/exam_seating_wizard.xml',
+        'wizard/exam_marks_import_wizard_view.xml',
         'views/student_registration_templates.xml',
         'views/exam_planning_views.xml',
         'views/student_registration_views.xml',
         'views/menu_view.xml',
         'views/exam_result_view.xml',
+        'views/exam_grading_scheme_views.xml',
         'views/exam_management_dashboard.xml', 
         'views/exam_conducting_view.xml',
         'views/student_exam_assignment_views.xml',
+        'views/exam_assignment_job_views.xml',
         'views/student_portal_template.xml',
         'views/exam_hall_view.xml',
         'views/exam_seating_view.xml',
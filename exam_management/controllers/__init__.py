@@ -1,3 +1,5 @@
 from . import main
 from . import portal
-from . import student_portal
\ No newline at end of file
+from . import student_portal
+from . import dashboard
+from . import exam_export
\ No newline at end of file
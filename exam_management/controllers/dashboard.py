@@ -0,0 +1,33 @@
+from odoo import http
+from odoo.http import request
+import json
+
+
+class ExamDashboardController(http.Controller):
+
+    @http.route('/exam_management/dashboard/data', type='http', auth='user', methods=['GET'])
+    def dashboard_data(self, course=None, page=1, **kw):
+        """Dashboard tables and KPIs as compact JSON, with ETag revalidation."""
+        if not request.env.user.has_group('exam_management.group_college_admin'):
+            return request.not_found()
+
+        try:
+            page = int(page)
+        except ValueError:
+            page = 1
+
+        # The ETag comes from cheap version stamps, so a revalidation is
+        # answered before any dashboard query or serialization runs
+        Dashboard = request.env['exam.dashboard']
+        etag = Dashboard._get_dashboard_version(course or None, page)
+        headers = [
+            ('ETag', f'"{etag}"'),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response(b'', headers=headers, status=304)
+
+        data = Dashboard._get_dashboard_data(course or None, page)
+        body = json.dumps(data, separators=(',', ':'), sort_keys=True, default=str)
+        return request.make_response(body, headers=headers + [('Content-Type', 'application/json')])
@@ -0,0 +1,35 @@
+from odoo import http
+from odoo.http import request
+from werkzeug.wsgi import wrap_file
+import json
+import tempfile
+
+
+class ExamExportController(http.Controller):
+
+    @http.route('/exam_management/exam_planning/export/<int:job_id>', type='http', auth='user', methods=['GET'])
+    def export_exam_planning(self, job_id, **kw):
+        """Stream the exam workbook from a temporary file, chunk by chunk."""
+        if not request.env.user.has_group('exam_management.group_college_admin'):
+            return request.not_found()
+
+        job = request.env['bulk.export.job'].browse(job_id).exists()
+        if not job or job.create_uid != request.env.user or job.res_model != 'exam.planning':
+            return request.not_found()
+        exams = request.env['exam.planning'].browse(json.loads(job.res_ids)).exists()
+        if not exams:
+            return request.not_found()
+
+        fileobj = tempfile.TemporaryFile()
+        exams._write_export_workbook(fileobj)
+        size = fileobj.tell()
+        fileobj.seek(0)
+
+        headers = [
+            ('Content-Type', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+            ('Content-Length', size),
+            ('Content-Disposition', 'attachment; filename="Exam_Planning_Export.xlsx"'),
+        ]
+        response = request.make_response(wrap_file(request.httprequest.environ, fileobj), headers=headers)
+        response.direct_passthrough = True
+        return response
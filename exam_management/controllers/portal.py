@@ -1,6 +1,7 @@
 from odoo import http
 from odoo.http import request
 from odoo.exceptions import AccessError
+from werkzeug.http import http_date
 
 
 class StudentPortal(http.Controller):
@@ -15,23 +16,13 @@ class StudentPortal(http.Controller):
         if not student:
             return request.redirect('/my')
 
-        # Fetch assigned exams
-        assigned_exams = request.env['student.exam.assignment'].sudo().search([
-            ('student_id', '=', student.id)
-        ])
-
-        results = []
-        if assigned_exams:
-            assigned_exam_ids = assigned_exams.mapped('exam_id.id')
-            results = request.env['exam.result'].sudo().search([
-                ('student_id', '=', student.id),
-                ('exam_id', 'in', assigned_exam_ids)
-            ])
+        # Whole exam history in a fixed number of queries, cached per student
+        data = student._get_portal_dashboard_data()
 
         return request.render('exam_management.student_portal_profile', {
             'student': student,
-            'assigned_exams': assigned_exams,
-            'results': results,
+            'assigned_exams': data['assignments'],
+            'results': data['results'],
         })
 
     # Result Download
@@ -52,12 +43,19 @@ class StudentPortal(http.Controller):
             if not student or result.student_id.id != student.id:
                 raise AccessError("You are not allowed to download this result.")
 
-        pdf_content, _ = request.env['ir.actions.report'].sudo()._render_qweb_pdf(
-            'exam_management.action_report_exam_result',
-            [result.id]
-        )
+        # Served from the publish-time cache, rendered live only on a miss
+        etag = result._report_cache_key()
+        cache_headers = [
+            ('ETag', f'"{etag}"'),
+            ('Last-Modified', http_date(result.write_date)),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response(b'', headers=cache_headers, status=304)
+
+        pdf_content = result._get_cached_pdf()
 
-        pdf_http_headers = [
+        pdf_http_headers = cache_headers + [
             ('Content-Type', 'application/pdf'),
             ('Content-Length', len(pdf_content)),
             ('Content-Disposition', 'attachment; filename="Result-%s.pdf"' % result.display_name.replace('/', '-')),
@@ -94,13 +92,18 @@ class StudentPortal(http.Controller):
         if not is_admin and seating.student_id.id != student.id:
             raise AccessError("You are not allowed to download this admit card.")
 
-        # Correct way to generate PDF
-        pdf_content, _ = request.env['ir.actions.report'].sudo()._render_qweb_pdf(
-            'exam_management.action_report_exam_admit_card',
-            [seating.id]
-        )
+        # Served from the pre-rendered cache; the card's content hash is the ETag
+        etag = seating.admit_card_hash
+        cache_headers = [
+            ('ETag', f'"{etag}"'),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+        if request.httprequest.if_none_match.contains(etag):
+            return request.make_response(b'', headers=cache_headers, status=304)
+
+        pdf_content = seating._get_cached_pdf()
 
-        pdf_http_headers = [
+        pdf_http_headers = cache_headers + [
             ('Content-Type', 'application/pdf'),
             ('Content-Length', len(pdf_content)),
             ('Content-Disposition', 'attachment; filename="Admit_Card-%s.pdf"' % student.student_name.replace('/', '-'))
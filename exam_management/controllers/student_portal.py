@@ -1,8 +1,12 @@
 from odoo import http
 from odoo.http import request
+from urllib.parse import urlencode
 
 class StudentPortal(http.Controller):
 
+    # Students shown per page of /my/student_list
+    _page_size = 50
+
     @http.route(['/my/student_list'], type='http', auth='user', website=True)
     def portal_student_list(self, **kwargs):
         Student = request.env['student.registration'].sudo()
@@ -16,7 +20,7 @@ class StudentPortal(http.Controller):
 
         domain = []
 
-        # Search filter
+        # Search filter (served by the trigram indexes)
         if search:
             domain += ['|', '|',
                 ('student_name', 'ilike', search),
@@ -36,11 +40,44 @@ class StudentPortal(http.Controller):
         if status:
             domain.append(('state', '=', status))
 
+        # Result filter
+        if result:
+            domain.append(('pass_fail', '=', result))
+
+        # Keyset paging on id: "after" moves forward, "before" moves back
+        try:
+            after = int(kwargs.get('after') or 0)
+            before = int(kwargs.get('before') or 0)
+        except ValueError:
+            after = before = 0
+
+        size = self._page_size
+        if before:
+            students = Student.search(domain + [('id', '<', before)], order='id desc', limit=size + 1)
+            has_prev = len(students) > size
+            students = students[:size].sorted('id')
+            has_next = True
+        else:
+            students = Student.search(domain + [('id', '>', after)], order='id', limit=size + 1)
+            has_next = len(students) > size
+            students = students[:size]
+            has_prev = bool(after)
+
+        count, count_exact = Student._estimate_count(domain)
 
-        students = Student.search(domain)
+        filters = {key: value for key, value in {
+            'search': search, 'course': course, 'semester': semester, 'status': status, 'result': result,
+        }.items() if value}
+        pager = {
+            'count': count,
+            'count_exact': count_exact,
+            'prev_url': students and has_prev and '/my/student_list?' + urlencode(dict(filters, before=students[0].id)),
+            'next_url': students and has_next and '/my/student_list?' + urlencode(dict(filters, after=students[-1].id)),
+        }
 
         return request.render("exam_management.student_portal_list", {
             'students': students,
+            'pager': pager,
             'search': search,
             'course': course,
             'semester': semester,
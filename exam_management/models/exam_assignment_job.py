@@ -0,0 +1,99 @@
+from odoo import models, fields, api
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ExamAssignmentJob(models.Model):
+    _name = 'exam.assignment.job'
+    _description = 'Exam Assignment Job'
+    _order = 'id'
+    _rec_name = 'exam_id'
+
+    # Students handled per transaction; progress is committed after each chunk
+    _chunk_size = 500
+
+    exam_id = fields.Many2one('exam.planning', string="Exam", required=True, ondelete='cascade')
+    course = fields.Selection(related='exam_id.course', store=True, string="Course")
+    class_semester = fields.Selection(related='exam_id.class_semester', store=True, string="Class & Semester")
+
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], string="Status", default='pending', required=True, index=True)
+
+    last_student_id = fields.Integer(string="Last Processed Student", default=0, readonly=True,
+                                     help="Resume cursor: students with a higher id are still pending")
+    student_total = fields.Integer(string="Students", readonly=True)
+    student_done = fields.Integer(string="Students Processed", readonly=True)
+    created_count = fields.Integer(string="Assignments Created", readonly=True)
+    skipped_count = fields.Integer(string="Assignments Skipped", readonly=True)
+    progress = fields.Float(string="Progress", compute='_compute_progress')
+    error = fields.Text(string="Error", readonly=True)
+    date_done = fields.Datetime(string="Finished On", readonly=True)
+
+    @api.depends('student_total', 'student_done')
+    def _compute_progress(self):
+        for job in self:
+            job.progress = (job.student_done / job.student_total * 100.0) if job.student_total else 0.0
+
+    @api.model
+    def _enqueue(self, exams):
+        """Create one pending job per exam and wake up the queue cron."""
+        jobs = self.create([{'exam_id': exam.id} for exam in exams])
+        cron = self.env.ref('exam_management.ir_cron_exam_assignment_queue', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+        return jobs
+
+    def action_retry(self):
+        """Put failed jobs back in the queue; they resume from their cursor."""
+        self.filtered(lambda job: job.state == 'failed').write({'state': 'pending', 'error': False})
+
+    @api.model
+    def _process_queue(self):
+        """Cron entry point: run pending jobs and resume the ones interrupted by a crash."""
+        jobs = self.search([('state', 'in', ('pending', 'running'))])
+        for job in jobs:
+            try:
+                job._run()
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.exception("Exam assignment job %s failed", job.id)
+                job.write({'state': 'failed', 'error': str(e)})
+                self.env.cr.commit()
+        return True
+
+    def _run(self):
+        self.ensure_one()
+        exam = self.exam_id
+        Student = self.env['student.registration']
+        Assignment = self.env['student.exam.assignment']
+        domain = [('course', '=', exam.course), ('class_semester', '=', exam.class_semester)]
+
+        if self.state == 'pending':
+            self.write({'state': 'running', 'student_total': Student.search_count(domain)})
+            self.env.cr.commit()
+
+        while True:
+            students = Student.search(
+                domain + [('id', '>', self.last_student_id)], order='id', limit=self._chunk_size
+            )
+            if not students:
+                break
+            stats = Assignment._assign_students_to_exam(exam, students)
+            # The cursor is committed together with the chunk it covers
+            self.write({
+                'last_student_id': students[-1].id,
+                'student_done': self.student_done + len(students),
+                'created_count': self.created_count + stats['created'],
+                'skipped_count': self.skipped_count + stats['skipped'],
+            })
+            self.env.cr.commit()
+
+        self.write({'state': 'done', 'date_done': fields.Datetime.now()})
+        self.env.cr.commit()
+        _logger.info("Exam assignment job %s done: %s created, %s skipped",
+                     self.id, self.created_count, self.skipped_count)
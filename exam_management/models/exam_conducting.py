@@ -1,4 +1,27 @@
 from odoo import models, fields, api
+from odoo.exceptions import ValidationError
+from datetime import datetime, time, timedelta
+import heapq
+
+
+def _overlapping_pairs(intervals):
+    """Return every pair of record ids whose intervals overlap.
+
+    ``intervals`` is a list of ``(start, end, record_id)``. Intervals are
+    sorted once and swept with a min-heap of active end times, so the cost
+    is O(n log n) plus the number of overlaps reported.
+    """
+    pairs = set()
+    active = []
+    for start, end, record_id in sorted(intervals):
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+        for _end, other_id in active:
+            if other_id != record_id:
+                pairs.add((min(other_id, record_id), max(other_id, record_id)))
+        heapq.heappush(active, (end, record_id))
+    return pairs
+
 
 class ExamConducting(models.Model):
     _name = 'exam.conducting'
@@ -41,6 +64,91 @@ class ExamConducting(models.Model):
         ('end', 'End'),
     ], string="Exam Status", default='start', tracking=True)
 
+    @api.constrains('exam_id', 'hall_id', 'invigilator_id')
+    def _check_schedule_clashes(self):
+        clashes = self._find_schedule_clashes()
+        if clashes:
+            raise ValidationError(
+                "Scheduling clashes found:\n" + "\n".join(self._format_clashes(clashes))
+            )
+
+    def _get_sitting_intervals(self):
+        """One (start, end) datetime interval per exam day of each sitting."""
+        intervals = {}
+        for rec in self:
+            exam = rec.exam_id
+            if not rec.exam_start_date or exam.duration <= 0:
+                continue
+            last_day = rec.exam_end_date or rec.exam_start_date
+            day = rec.exam_start_date
+            while day <= last_day:
+                start = datetime.combine(day, time.min) + timedelta(hours=exam.exam_time)
+                intervals.setdefault(rec.id, []).append((start, start + timedelta(hours=exam.duration)))
+                day += timedelta(days=1)
+        return intervals
+
+    def _find_schedule_clashes(self):
+        """Return the hall and invigilator double bookings involving ``self``.
+
+        Every sitting that could collide with the batch (same hall or
+        invigilator, overlapping dates) is loaded with one search, then an
+        interval index per hall and per invigilator is swept once.  The
+        result is a list of ``(kind, resource, sitting_a, sitting_b)``.
+        """
+        dated = self.filtered('exam_start_date')
+        if not dated:
+            return []
+
+        first_day = min(dated.mapped('exam_start_date'))
+        last_day = max(rec.exam_end_date or rec.exam_start_date for rec in dated)
+        candidates = self | self.search([
+            ('id', 'not in', self.ids),
+            '|', ('hall_id', 'in', dated.hall_id.ids), ('invigilator_id', 'in', dated.invigilator_id.ids),
+            ('exam_start_date', '<=', last_day),
+            '|', ('exam_end_date', '>=', first_day),
+            '&', ('exam_end_date', '=', False), ('exam_start_date', '>=', first_day),
+        ])
+
+        intervals = candidates._get_sitting_intervals()
+        by_hall = {}
+        by_invigilator = {}
+        for rec in candidates:
+            for start, end in intervals.get(rec.id, []):
+                by_hall.setdefault(rec.hall_id, []).append((start, end, rec.id))
+                by_invigilator.setdefault(rec.invigilator_id, []).append((start, end, rec.id))
+
+        batch_ids = set(self.ids)
+        clashes = []
+        for kind, index in (('hall', by_hall), ('invigilator', by_invigilator)):
+            for resource, resource_intervals in index.items():
+                for id_a, id_b in sorted(_overlapping_pairs(resource_intervals)):
+                    if id_a in batch_ids or id_b in batch_ids:
+                        clashes.append((kind, resource, self.browse(id_a), self.browse(id_b)))
+        return clashes
+
+    @api.model
+    def _format_clashes(self, clashes):
+        return [
+            f"{'Hall' if kind == 'hall' else 'Invigilator'} {resource.display_name}: "
+            f"{sitting_a.exam_id.exam_name} overlaps {sitting_b.exam_id.exam_name}"
+            for kind, resource, sitting_a, sitting_b in clashes
+        ]
+
+    def action_check_schedule_clashes(self):
+        """Validate the selected sittings as one timetable and list every clash."""
+        records = self or self.search([])
+        clashes = records._find_schedule_clashes()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': f'{len(clashes)} Scheduling Clashes' if clashes else 'No Scheduling Clashes',
+                'message': "\n".join(self._format_clashes(clashes)) or f'{len(records)} sittings checked.',
+                'type': 'danger' if clashes else 'success',
+                'sticky': bool(clashes),
+            }
+        }
+
     def action_start(self):
         """Move exam to Ongoing"""
         for rec in self:
@@ -101,7 +209,8 @@ class ExamConducting(models.Model):
         template = self.env.ref("exam_management.mail_template_invigilator_assignment")
         for record in self:
             if template and record.invigilator_id and record.invigilator_id.email:
-                template.send_mail(record.id, force_send=True)
+                template.send_mail(record.id)
+        self.env['mail.mail']._trigger_exam_mail_queue()
 
 
 class ExamConductingLine(models.Model):
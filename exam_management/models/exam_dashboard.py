@@ -1,9 +1,37 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from datetime import date
+import hashlib
 import logging
 
 _logger = logging.getLogger(__name__)
 
+
+class ExamDashboardKpiMixin(models.AbstractModel):
+    """Bump the dashboard KPI version whenever a counted record changes."""
+    _name = 'exam.dashboard.kpi.mixin'
+    _description = 'Exam Dashboard KPI Invalidation'
+
+    # Only these fields change which records the KPI counts match
+    _dashboard_kpi_fields = {'course', 'active', 'company_id'}
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['exam.dashboard']._bump_kpi_version()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if self._dashboard_kpi_fields.intersection(vals):
+            self.env['exam.dashboard']._bump_kpi_version()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env['exam.dashboard']._bump_kpi_version()
+        return res
+
+
 class ExamDashboard(models.TransientModel):
     _name = 'exam.dashboard'
     _description = 'Exam Dashboard'
@@ -15,11 +43,6 @@ class ExamDashboard(models.TransientModel):
     total_halls = fields.Integer(string='Total Halls', readonly=True)
     total_seatings = fields.Integer(string='Total Seatings', readonly=True)
 
-    # HTML table fields for display
-    upcoming_exams_table = fields.Html(string="Upcoming Exams Table", readonly=True)
-    exams_today_table = fields.Html(string="Exams Today Table", readonly=True)
-    unassigned_students_table = fields.Html(string="Unassigned Students Table", readonly=True)
-
     # Filter: Course
     def _get_course_selection(self):
         course_field = self.env['exam.planning'].fields_get(allfields=['course']).get('course', {})
@@ -55,403 +78,150 @@ class ExamDashboard(models.TransientModel):
         for record in self:
             record.display_name = f"Exam Dashboard - {fields.Date.context_today(record)}"
 
-    def _get_exam_planning_url(self, exam_id):
-        """Generate URL for exam planning record"""
-        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
-        return f"{base_url}/web#id={exam_id}&model=exam.planning&view_type=form"
-
-    def _get_student_registration_url(self, student_id):
-        """Generate URL for student registration record"""
-        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
-        return f"{base_url}/web#id={student_id}&model=student.registration&view_type=form"
-
     @api.model
     def default_get(self, fields_list):
         res = super().default_get(fields_list)
-        today = date.today()
-
         try:
-            # KPI counts
-            res['total_exams'] = self.env['exam.planning'].search_count([])
-            res['total_students'] = self.env['student.registration'].search_count([])
-            res['total_halls'] = self.env['exam.hall'].search_count([])
-            res['total_seatings'] = self.env['exam.seating'].search_count([])
-
-            # Get selection mappings
-            course_mapping = dict(self.env['exam.planning'].fields_get(allfields=['course'])['course']['selection'])
-            semester_mapping = dict(self.env['exam.planning'].fields_get(allfields=['class_semester'])['class_semester']['selection'])
-
-            # ========== UPCOMING EXAMS TABLE ==========
-            upcoming = self.env['exam.planning'].search(
-                [('exam_start_date', '>', today), ('active', '=', True)],
-                order='exam_start_date asc',
-                limit=10
-            )
-
-            upcoming_html_rows = []
-            for rec in upcoming:
-                try:
-                    time_str = 'No Time'
-                    if hasattr(rec, 'exam_time') and rec.exam_time:
-                        hours = int(rec.exam_time)
-                        minutes = int((rec.exam_time - hours) * 60)
-                        time_str = f"{hours:02d}:{minutes:02d}"
-
-                    course_full_name = course_mapping.get(rec.course, "No Course")
-                    semester_full_name = semester_mapping.get(rec.class_semester, "No Semester")
-                    exam_date = rec.exam_start_date.strftime('%d-%m-%Y') if rec.exam_start_date else 'No Date'
-                    
-                    # Generate proper URL for the record
-                    exam_url = self._get_exam_planning_url(rec.id)
-
-                    upcoming_html_rows.append(f"""
-                        <tr class="exam-row">
-                            <td>{rec.exam_name or 'No Name'}<br><small class='text-muted'>{rec.exam_code or 'No Code'}</small></td>
-                            <td>{exam_date}<br><small class='text-muted'>{time_str}</small></td>
-                            <td>{course_full_name}<br><small>{semester_full_name}</small></td>
-                            <td>
-                                <a href="{exam_url}" role="button" class="btn btn-primary btn-sm exam-detail-btn" data-exam-id="{rec.id}">
-                                    <i class="fa fa-eye"></i> Course Info
-                                </a>
-                            </td>
-                        </tr>
-                    """)
-                except Exception as e:
-                    _logger.warning(f"Error processing upcoming exam {rec.id}: {e}")
-                    continue
-
-            if upcoming_html_rows:
-                res['upcoming_exams_table'] = f"""
-                <div class="table-responsive">
-                    <table class="table table-striped table-hover mb-0">
-                        <thead class="table-light">
-                            <tr>
-                                <th>Exam Details</th>
-                                <th>Date &amp; Time</th>
-                                <th>Course Info</th>
-                                <th>Action</th>
-                            </tr>
-                        </thead>
-                        <tbody>{"".join(upcoming_html_rows)}</tbody>
-                    </table>
-                </div>"""
-            else:
-                res['upcoming_exams_table'] = """<div class="text-center py-4"><p>No Upcoming Exams</p></div>"""
-
-            # ========== EXAMS TODAY TABLE ==========
-            exams_today_recs = self.env['exam.planning'].search([('exam_start_date', '=', today), ('active', '=', True)])
-            
-            exams_today_html_rows = []
-            for rec in exams_today_recs:
-                try:
-                    hall_names = ", ".join(rec.hall_ids.mapped('name')) if hasattr(rec, 'hall_ids') and rec.hall_ids else "No Hall Assigned"
-                    time_str = f"{int(rec.exam_time):02d}:{int((rec.exam_time - int(rec.exam_time)) * 60):02d}" if hasattr(rec, 'exam_time') and rec.exam_time else 'No Time'
-                    course_full_name = course_mapping.get(rec.course, rec.course or 'No Course')
-                    semester_full_name = semester_mapping.get(rec.class_semester, rec.class_semester or 'No Semester')
-                    
-                    exam_url = self._get_exam_planning_url(rec.id)
-
-                    exams_today_html_rows.append(f"""
-                        <tr class="exam-row">
-                            <td>
-                                <a href="{exam_url}" role="button" class="btn btn-sm btn-outline-primary exam-detail-btn" data-exam-id="{rec.id}">
-                                    <i class="fa fa-eye"></i> {rec.exam_name or 'No Name'}
-                                </a>
-                                <br><small class='text-muted'>{rec.exam_code or 'No Code'}</small>
-                            </td>
-                            <td>{time_str}</td>
-                            <td>{hall_names}</td>
-                            <td><small>{course_full_name}<br>{semester_full_name}</small></td>
-                        </tr>
-                    """)
-                except Exception as e:
-                    _logger.warning(f"Error processing today's exam {rec.id}: {e}")
-                    continue
-
-            if exams_today_html_rows:
-                res['exams_today_table'] = f"""
-                <div class="table-responsive">
-                    <table class="table table-striped mb-0">
-                        <thead class="table-light">
-                            <tr>
-                                <th>Exam Details</th>
-                                <th>Time</th>
-                                <th>Hall</th>
-                                <th>Course Info</th>
-                            </tr>
-                        </thead>
-                        <tbody>{"".join(exams_today_html_rows)}</tbody>
-                    </table>
-                </div>"""
-            else:
-                res['exams_today_table'] = """<div class="text-center py-4"><p>No Exams Scheduled Today</p></div>"""
-
-            # ========== UNASSIGNED STUDENTS (Confirmed & Cancelled Separate) ==========
-            confirmed_html_rows = []
-            cancelled_html_rows = []
-
-            students = self.env['student.registration'].search([], limit=50)
-            for student in students:
-                try:
-                    if hasattr(student, 'course') and hasattr(student, 'class_semester'):
-                        exams = self.env['exam.planning'].search([
-                            ('course', '=', student.course), 
-                            ('class_semester', '=', student.class_semester)
-                        ], limit=1)
-
-                        course_full_name = course_mapping.get(student.course, student.course or 'No Course')
-                        semester_full_name = semester_mapping.get(student.class_semester, student.class_semester or 'No Semester')
-
-                        # Registration Badge
-                        if student.state == 'confirm':
-                            registration_status_html = "<td><span class='badge bg-success'>Confirmed</span></td>"
-                        elif student.state == 'cancel':
-                            registration_status_html = "<td><span class='badge bg-danger'>Cancelled</span></td>"
-                        else:
-                            registration_status_html = "<td><span class='badge bg-secondary'>Unknown</span></td>"
-
-                        status_html = ""
-                        action_html = ""
-
-                        if not exams:
-                            status_html = "<td><span class='badge rounded-pill bg-warning'>No Exam Available</span></td>"
-                            student_url = self._get_student_registration_url(student.id)
-                            action_html = f"""<td><a href="{student_url}" role="button" class="btn btn-primary btn-sm view-profile-btn"><i class="fa fa-user"></i> View Profile</a></td>"""
-                        elif 'student.exam.assignment' in self.env:
-                            assigned = self.env['student.exam.assignment'].search_count([
-                                ('student_id', '=', student.id),
-                                ('exam_id', 'in', exams.ids)
-                            ])
-                            if not assigned:
-                                status_html = "<td><span class='badge bg-danger'>Not Assigned</span></td>"
-                                student_url = self._get_student_registration_url(student.id)
-                                action_html = f"""<td><a href="{student_url}" role="button" class="btn btn-primary btn-sm view-profile-btn"><i class="fa fa-user"></i> View Profile</a></td>"""
-
-                        if action_html:
-                            row_html = f"""
-                                <tr class="student-row">
-                                    <td>{student.student_name or 'No Name'}</td>
-                                    <td>{course_full_name}</td>
-                                    <td>{semester_full_name}</td>
-                                    {registration_status_html}
-                                    {status_html}
-                                    {action_html}
-                                </tr>
-                            """
-                            if student.state == 'confirm':
-                                confirmed_html_rows.append(row_html)
-                            elif student.state == 'cancel':
-                                cancelled_html_rows.append(row_html)
-                except Exception as e:
-                    _logger.warning(f"Error processing student {student.id}: {e}")
-                    continue
-
-            tables_html = ""
-            if confirmed_html_rows:
-                tables_html += f"""
-            <div class="card border-success mb-3">
-                <div class="card-header bg-success text-white fw-bold">
-                    Confirmed Registrations
-                </div>
-                <div class="table-responsive">
-                    <table class="table table-striped mb-0">
-                        <thead class="table-light">
-                            <tr>
-                                <th>Student Name</th>
-                                <th>Course</th>
-                                <th>Semester</th>
-                                <th>Registration Status</th>
-                                <th>Status</th>
-                                <th>Action</th>
-                            </tr>
-                        </thead>
-                        <tbody>{"".join(confirmed_html_rows)}</tbody>
-                    </table>
-                </div>
-            </div>"""
-
-            if cancelled_html_rows:
-                tables_html += f"""
-            <div class="card border-danger mb-3">
-                <div class="card-header bg-danger text-white fw-bold">
-                    Cancelled Registrations
-                </div>
-                <div class="table-responsive">
-                    <table class="table table-striped mb-0">
-                        <thead class="table-light">
-                            <tr>
-                                <th>Student Name</th>
-                                <th>Course</th>
-                                <th>Semester</th>
-                                <th>Registration Status</th>
-                                <th>Status</th>
-                                <th>Action</th>
-                            </tr>
-                        </thead>
-                        <tbody>{"".join(cancelled_html_rows)}</tbody>
-                    </table>
-                </div>
-            </div>"""
-
-            if not confirmed_html_rows and not cancelled_html_rows:
-                tables_html = """<div class="text-center py-4"><p>All Students Assigned!</p></div>"""
-
-            res['unassigned_students_table'] = tables_html
-
+            res.update(self._get_kpis())
         except Exception as e:
             _logger.error(f"Error in dashboard generation: {e}")
-            res.update({
-                'upcoming_exams_table': '<div class="alert alert-danger">Error loading data</div>',
-                'exams_today_table': '<div class="alert alert-danger">Error loading data</div>',
-                'unassigned_students_table': '<div class="alert alert-danger">Error loading data</div>',
-            })
-        return res                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                     
-
-    def _generate_tables(self, course_code=None):
-        today = date.today()
-        course_mapping = dict(self.env['exam.planning'].fields_get(allfields=['course'])['course']['selection'])
-        semester_mapping = dict(self.env['exam.planning'].fields_get(allfields=['class_semester'])['class_semester']['selection'])
-
-        # Upcoming exams
-        upcoming_domain = [('exam_start_date', '>', today), ('active', '=', True)]
-        if course_code:
-            upcoming_domain.append(('course', '=', course_code))
-        upcoming = self.env['exam.planning'].search(upcoming_domain, order='exam_start_date asc', limit=10)
-
-        upcoming_html_rows = []
-        for rec in upcoming:
-            try:
-                time_str = 'No Time'
-                if hasattr(rec, 'exam_time') and rec.exam_time:
-                    hours = int(rec.exam_time)
-                    minutes = int((rec.exam_time - hours) * 60)
-                    time_str = f"{hours:02d}:{minutes:02d}"
-
-                course_full_name = course_mapping.get(rec.course, "No Course")
-                semester_full_name = semester_mapping.get(rec.class_semester, "No Semester")
-                exam_date = rec.exam_start_date.strftime('%d-%m-%Y') if rec.exam_start_date else 'No Date'
-                exam_url = self._get_exam_planning_url(rec.id)
-
-                upcoming_html_rows.append(f"""
-                    <tr class=\"exam-row\">
-                        <td>{rec.exam_name or 'No Name'}<br><small class='text-muted'>{rec.exam_code or 'No Code'}</small></td>
-                        <td>{exam_date}<br><small class='text-muted'>{time_str}</small></td>
-                        <td>{course_full_name}<br><small>{semester_full_name}</small></td>
-                        <td>
-                            <a href=\"{exam_url}\" role=\"button\" class=\"btn btn-primary btn-sm exam-detail-btn\" data-exam-id=\"{rec.id}\">\n                                <i class=\"fa fa-eye\"></i> Course Info\n                            </a>
-                        </td>
-                    </tr>
-                """)
-            except Exception as e:
-                _logger.warning(f"Error processing upcoming exam {rec.id}: {e}")
-                continue
-
-        if upcoming_html_rows:
-            upcoming_table_html = f"""
-            <div class=\"table-responsive\">\n                <table class=\"table table-striped table-hover mb-0\">\n                    <thead class=\"table-light\">\n                        <tr>\n                            <th>Exam Details</th>\n                            <th>Date &amp; Time</th>\n                            <th>Course Info</th>\n                            <th>Action</th>\n                        </tr>\n                    </thead>\n                    <tbody>{"".join(upcoming_html_rows)}</tbody>\n                </table>\n            </div>"""
-        else:
-            upcoming_table_html = """<div class=\"text-center py-4\"><p>No Upcoming Exams</p></div>"""
-
-        # Exams today
-        today_domain = [('exam_start_date', '=', today), ('active', '=', True)]
-        if course_code:
-            today_domain.append(('course', '=', course_code))
-        exams_today_recs = self.env['exam.planning'].search(today_domain)
+        return res
 
-        exams_today_html_rows = []
-        for rec in exams_today_recs:
-            try:
-                hall_names = ", ".join(rec.hall_ids.mapped('name')) if hasattr(rec, 'hall_ids') and rec.hall_ids else "No Hall Assigned"
-                time_str = f"{int(rec.exam_time):02d}:{int((rec.exam_time - int(rec.exam_time)) * 60):02d}" if hasattr(rec, 'exam_time') and rec.exam_time else 'No Time'
-                course_full_name = course_mapping.get(rec.course, rec.course or 'No Course')
-                semester_full_name = semester_mapping.get(rec.class_semester, rec.class_semester or 'No Semester')
-                exam_url = self._get_exam_planning_url(rec.id)
-
-                exams_today_html_rows.append(f"""
-                    <tr class=\"exam-row\">\n                        <td>\n                            <a href=\"{exam_url}\" role=\"button\" class=\"btn btn-sm btn-outline-primary exam-detail-btn\" data-exam-id=\"{rec.id}\">\n                                <i class=\"fa fa-eye\"></i> {rec.exam_name or 'No Name'}\n                            </a>\n                            <br><small class='text-muted'>{rec.exam_code or 'No Code'}</small>\n                        </td>\n                        <td>{time_str}</td>\n                        <td>{hall_names}</td>\n                        <td><small>{course_full_name}<br>{semester_full_name}</small></td>\n                    </tr>
-                """)
-            except Exception as e:
-                _logger.warning(f"Error processing today's exam {rec.id}: {e}")
-                continue
-
-        if exams_today_html_rows:
-            exams_today_table_html = f"""
-            <div class=\"table-responsive\">\n                <table class=\"table table-striped mb-0\">\n                    <thead class=\"table-light\">\n                        <tr>\n                            <th>Exam Details</th>\n                            <th>Time</th>\n                            <th>Hall</th>\n                            <th>Course Info</th>\n                        </tr>\n                    </thead>\n                    <tbody>{"".join(exams_today_html_rows)}</tbody>\n                </table>\n            </div>"""
-        else:
-            exams_today_table_html = """<div class=\"text-center py-4\"><p>No Exams Scheduled Today</p></div>"""
-
-        # Unassigned students
-        confirmed_html_rows = []
-        cancelled_html_rows = []
-        student_domain = []
-        if course_code:
-            student_domain.append(('course', '=', course_code))
-        students = self.env['student.registration'].search(student_domain, limit=50)
-        for student in students:
-            try:
-                if hasattr(student, 'course') and hasattr(student, 'class_semester'):
-                    exams = self.env['exam.planning'].search([
-                        ('course', '=', student.course),
-                        ('class_semester', '=', student.class_semester)
-                    ], limit=1)
-
-                    course_full_name = course_mapping.get(student.course, student.course or 'No Course')
-                    semester_full_name = semester_mapping.get(student.class_semester, student.class_semester or 'No Semester')
-
-                    if student.state == 'confirm':
-                        registration_status_html = "<td><span class='badge bg-success'>Confirmed</span></td>"
-                    elif student.state == 'cancel':
-                        registration_status_html = "<td><span class='badge bg-danger'>Cancelled</span></td>"
-                    else:
-                        registration_status_html = "<td><span class='badge bg-secondary'>Unknown</span></td>"
-
-                    status_html = ""
-                    action_html = ""
-
-                    if not exams:
-                        status_html = "<td><span class='badge rounded-pill bg-warning'>No Exam Available</span></td>"
-                        student_url = self._get_student_registration_url(student.id)
-                        action_html = f"""<td><a href=\"{student_url}\" role=\"button\" class=\"btn btn-primary btn-sm view-profile-btn\"><i class=\"fa fa-user\"></i> View Profile</a></td>"""
-                    elif 'student.exam.assignment' in self.env:
-                        assigned = self.env['student.exam.assignment'].search_count([
-                            ('student_id', '=', student.id),
-                            ('exam_id', 'in', exams.ids)
-                        ])
-                        if not assigned:
-                            status_html = "<td><span class='badge bg-danger'>Not Assigned</span></td>"
-                            student_url = self._get_student_registration_url(student.id)
-                            action_html = f"""<td><a href=\"{student_url}\" role=\"button\" class=\"btn btn-primary btn-sm view-profile-btn\"><i class=\"fa fa-user\"></i> View Profile</a></td>"""
-
-                    if action_html:
-                        row_html = f"""
-                            <tr class=\"student-row\">\n                                <td>{student.student_name or 'No Name'}</td>\n                                <td>{course_full_name}</td>\n                                <td>{semester_full_name}</td>\n                                {registration_status_html}\n                                {status_html}\n                                {action_html}\n                            </tr>
-                        """
-                        if student.state == 'confirm':
-                            confirmed_html_rows.append(row_html)
-                        elif student.state == 'cancel':
-                            cancelled_html_rows.append(row_html)
-            except Exception as e:
-                _logger.warning(f"Error processing student {student.id}: {e}")
-                continue
+    # Rows per page of the unassigned students table
+    _unassigned_page_size = 50
 
-        tables_html = ""
-        if confirmed_html_rows:
-            tables_html += f"""
-        <div class=\"card border-success mb-3\">\n            <div class=\"card-header bg-success text-white fw-bold\">\n                Confirmed Registrations\n            </div>\n            <div class=\"table-responsive\">\n                <table class=\"table table-striped mb-0\">\n                    <thead class=\"table-light\">\n                        <tr>\n                            <th>Student Name</th>\n                            <th>Course</th>\n                            <th>Semester</th>\n                            <th>Registration Status</th>\n                            <th>Status</th>\n                            <th>Action</th>\n                        </tr>\n                    </thead>\n                    <tbody>{"".join(confirmed_html_rows)}</tbody>\n                </table>\n            </div>\n        </div>"""
+    @api.model
+    def _get_dashboard_data(self, course_code=None, page=1):
+        """Compact payload behind ``/exam_management/dashboard/data``.
 
-        if cancelled_html_rows:
-            tables_html += f"""
-        <div class=\"card border-danger mb-3\">\n            <div class=\"card-header bg-danger text-white fw-bold\">\n                Cancelled Registrations\n            </div>\n            <div class=\"table-responsive\">\n                <table class=\"table table-striped mb-0\">\n                    <thead class=\"table-light\">\n                        <tr>\n                            <th>Student Name</th>\n                            <th>Course</th>\n                            <th>Semester</th>\n                            <th>Registration Status</th>\n                            <th>Status</th>\n                            <th>Action</th>\n                        </tr>\n                    </thead>\n                    <tbody>{"".join(cancelled_html_rows)}</tbody>\n                </table>\n            </div>\n        </div>"""
+        Tables are plain row arrays rendered client side:
 
-        if not confirmed_html_rows and not cancelled_html_rows:
-            tables_html = """<div class=\"text-center py-4\"><p>All Students Assigned!</p></div>"""
+        * ``upcoming``: [id, name, code, date, time, course, semester]
+        * ``today``: [id, name, code, time, halls, course, semester]
+        * ``unassigned.rows``: [id, name, course, semester, state, no_exam]
+        """
+        today = date.today()
+        Exam = self.env['exam.planning']
+        course_mapping = dict(Exam.fields_get(allfields=['course'])['course']['selection'])
+        semester_mapping = dict(Exam.fields_get(allfields=['class_semester'])['class_semester']['selection'])
+        exam_fields = ['exam_name', 'exam_code', 'exam_start_date', 'exam_time', 'course', 'class_semester']
+        course_domain = [('course', '=', course_code)] if course_code else []
+
+        upcoming = Exam.search_read(
+            [('exam_start_date', '>', today), ('active', '=', True)] + course_domain,
+            exam_fields, order='exam_start_date asc', limit=10
+        )
+        exams_today = Exam.search_read(
+            [('exam_start_date', '=', today), ('active', '=', True)] + course_domain,
+            exam_fields
+        )
+
+        halls_by_exam = {}
+        if exams_today:
+            for hall in self.env['exam.hall'].search_read(
+                [('exam_id', 'in', [rec['id'] for rec in exams_today])], ['exam_id', 'name'], load=None
+            ):
+                halls_by_exam.setdefault(hall['exam_id'], []).append(hall['name'])
+
+        def time_str(rec):
+            return Exam.format_float_time(rec['exam_time']) if rec['exam_time'] else 'No Time'
+
+        page = max(page, 1)
+        rows, total = self._get_unassigned_students(
+            course_code, limit=self._unassigned_page_size,
+            offset=(page - 1) * self._unassigned_page_size
+        )
 
         return {
-            'upcoming_exams_table': upcoming_table_html,
-            'exams_today_table': exams_today_table_html,
-            'unassigned_students_table': tables_html,
+            'upcoming': [[
+                rec['id'],
+                rec['exam_name'] or 'No Name',
+                rec['exam_code'] or 'No Code',
+                rec['exam_start_date'].strftime('%d-%m-%Y') if rec['exam_start_date'] else 'No Date',
+                time_str(rec),
+                course_mapping.get(rec['course'], 'No Course'),
+                semester_mapping.get(rec['class_semester'], 'No Semester'),
+            ] for rec in upcoming],
+            'today': [[
+                rec['id'],
+                rec['exam_name'] or 'No Name',
+                rec['exam_code'] or 'No Code',
+                time_str(rec),
+                ", ".join(halls_by_exam.get(rec['id'], [])) or 'No Hall Assigned',
+                course_mapping.get(rec['course'], rec['course'] or 'No Course'),
+                semester_mapping.get(rec['class_semester'], rec['class_semester'] or 'No Semester'),
+            ] for rec in exams_today],
+            'unassigned': {
+                'page': page,
+                'page_size': self._unassigned_page_size,
+                'total': total,
+                'rows': [[
+                    row['id'],
+                    row['student_name'] or 'No Name',
+                    course_mapping.get(row['course'], row['course'] or 'No Course'),
+                    semester_mapping.get(row['class_semester'], row['class_semester'] or 'No Semester'),
+                    row['state'],
+                    row['no_exam'],
+                ] for row in rows],
+            },
         }
 
+    # Models shown on the dashboard; all of them have a ``course`` field
+    _dashboard_data_models = ('exam.planning', 'exam.hall', 'exam.seating',
+                              'student.registration', 'student.exam.assignment')
+
+    @api.model
+    def _get_dashboard_version(self, course_code=None, page=1):
+        """Cheap version stamp of ``_get_dashboard_data``: record count and
+        latest write date per model for the course, plus the day (upcoming
+        and today's exams depend on it), the page and the companies."""
+        course_domain = [('course', '=', course_code)] if course_code else []
+        stamp = [str(date.today()), course_code or '', page, self.env.companies.ids]
+        for model in self._dashboard_data_models:
+            [(count, last_write)] = self.env[model]._read_group(course_domain, [], ['__count', 'write_date:max'])
+            stamp.append((model, count, str(last_write)))
+        return hashlib.sha1(repr(stamp).encode()).hexdigest()
+
+    def _get_unassigned_students(self, course_code=None, limit=None, offset=0):
+        """Return ``(rows, total)`` for students not assigned to any exam of
+        their course and semester, in a single grouped query.
+
+        Students are left-joined against the active exams of their
+        (course, class_semester) and anti-joined against their assignments;
+        ``no_exam`` tells whether a matching exam exists at all.
+        """
+        for model in ('student.registration', 'exam.planning', 'student.exam.assignment'):
+            self.env[model].flush_model()
+
+        where = "s.state IN ('confirm', 'cancel')"
+        params = []
+        if course_code:
+            where += " AND s.course = %s"
+            params.append(course_code)
+        params += [limit, offset]
+
+        self.env.cr.execute(f"""
+            SELECT s.id, s.student_name, s.course, s.class_semester, s.state,
+                   COUNT(e.id) = 0 AS no_exam,
+                   COUNT(*) OVER () AS total
+              FROM student_registration s
+         LEFT JOIN exam_planning e
+                ON e.course = s.course
+               AND e.class_semester = s.class_semester
+               AND e.active
+         LEFT JOIN student_exam_assignment a
+                ON a.student_id = s.id
+               AND a.exam_id = e.id
+             WHERE {where}
+          GROUP BY s.id
+            HAVING COUNT(a.id) = 0
+          ORDER BY s.id
+             LIMIT %s OFFSET %s
+        """, params)
+        rows = self.env.cr.dictfetchall()
+        total = rows[0]['total'] if rows else 0
+        return rows, total
+
     def _generate_kpis(self, course_code=None):
         exam_domain = []
         student_domain = []
@@ -471,15 +241,57 @@ class ExamDashboard(models.TransientModel):
             'total_seatings': self.env['exam.seating'].search_count(seating_domain),
         }
 
+    # Database sequence used as version stamp of the KPI cache
+    _kpi_version_sequence = 'exam_dashboard_kpi_version'
+
+    def init(self):
+        super().init()
+        self.env.cr.execute(f"CREATE SEQUENCE IF NOT EXISTS {self._kpi_version_sequence}")
+
+    @api.model
+    def _get_kpi_version(self):
+        self.env.cr.execute(f"SELECT last_value FROM {self._kpi_version_sequence}")
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _bump_kpi_version(self):
+        """Move the KPI version forward now and once more after commit.
+
+        The sequence is shared by all workers without touching the registry
+        caches.  A worker reading between both bumps may cache counts that
+        miss the uncommitted change; the second bump retires that entry.
+        """
+        self.env.cr.execute(f"SELECT nextval('{self._kpi_version_sequence}')")
+        postcommit = self.env.cr.postcommit
+        if not postcommit.data.get(self._kpi_version_sequence):
+            postcommit.data[self._kpi_version_sequence] = True
+            registry = self.env.registry
+            sequence = self._kpi_version_sequence
+
+            def bump():
+                with registry.cursor() as cr:
+                    cr.execute(f"SELECT nextval('{sequence}')")
+            postcommit.add(bump)
+
+    @api.model
+    @tools.ormcache('company_id', 'course_code', 'version')
+    def _get_cached_kpis(self, company_id, course_code, version):
+        return self._generate_kpis(course_code)
+
+    @api.model
+    def _get_kpis(self, course_code=None):
+        """KPI counts served from the per (company, course) cache, keyed on
+        the version that ``exam.dashboard.kpi.mixin`` bumps on any relevant
+        change."""
+        return dict(self._get_cached_kpis(self.env.company.id, course_code or False, self._get_kpi_version()))
+
     @api.onchange('course_filter')
     def _onchange_course_filter(self):
         for record in self:
             try:
-                tables = record._generate_tables(record.course_filter)
-                kpis = record._generate_kpis(record.course_filter)
-                record.update({**tables, **kpis})
+                record.update(record._get_kpis(record.course_filter))
             except Exception as e:
-                _logger.error(f"Error updating tables on course filter change: {e}")
+                _logger.error(f"Error updating KPIs on course filter change: {e}")
 
     @api.model
     def open_dashboard(self):
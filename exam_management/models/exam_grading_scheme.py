@@ -0,0 +1,164 @@
+from odoo import models, fields, api
+from bisect import bisect_right
+
+
+class GradingTable:
+    """Sorted percentage cut-offs of one grading scheme.
+
+    ``grade(p)`` and ``category(p)`` bin a percentage with a binary search,
+    so a whole recordset is graded in O(n log k) without per-record
+    if/elif chains.
+    """
+
+    def __init__(self, pass_percentage, grade_cutoffs, category_cutoffs):
+        self.pass_percentage = pass_percentage
+        grade_cutoffs = sorted(grade_cutoffs)
+        category_cutoffs = sorted(category_cutoffs)
+        self._grade_bounds = [bound for bound, _value in grade_cutoffs]
+        self._grade_values = [value for _bound, value in grade_cutoffs]
+        self._category_bounds = [bound for bound, _value in category_cutoffs]
+        self._category_values = [value for _bound, value in category_cutoffs]
+
+    def is_pass(self, percentage):
+        return percentage >= self.pass_percentage
+
+    def grade(self, percentage):
+        if not self.is_pass(percentage):
+            return 'F'
+        index = bisect_right(self._grade_bounds, percentage)
+        return self._grade_values[index - 1] if index else 'D'
+
+    def category(self, percentage):
+        index = bisect_right(self._category_bounds, percentage)
+        return self._category_values[index - 1] if index else 'fail'
+
+
+class ExamGradingScheme(models.Model):
+    _name = 'exam.grading.scheme'
+    _description = 'Exam Grading Scheme'
+    _order = 'sequence, id'
+
+    # Policy used when no scheme matches an exam
+    _default_pass_percentage = 33.0
+    _default_grade_cutoffs = [(33.0, 'D'), (55.0, 'C'), (70.0, 'B'), (85.0, 'A')]
+    _default_category_cutoffs = [
+        (40.0, 'pass_class'), (50.0, 'second_class'), (60.0, 'first_class'), (75.0, 'distinction'),
+    ]
+
+    name = fields.Char(string="Name", required=True)
+    sequence = fields.Integer(default=10)
+    active = fields.Boolean(default=True)
+    exam_id = fields.Many2one('exam.planning', string="Exam", ondelete='cascade',
+                              help="Applies to this exam only; takes precedence over course schemes")
+    course = fields.Selection([
+        ('IT', 'Information Technology'),
+        ('CS', 'Computer Science'),
+        ('EC', 'Electronics'),
+        ('ME', 'Mechanical'),
+        ('CE', 'Civil'),
+        ('EE', 'Electrical'),
+        ('BT', 'Biotechnology'),
+        ('CH', 'Chemical'),
+    ], string='Course', help="Applies to every exam of this course; leave empty for all courses")
+    pass_percentage = fields.Float(string="Pass Percentage", default=33.0, required=True)
+    line_ids = fields.One2many('exam.grading.scheme.line', 'scheme_id', string="Cut-offs", copy=True)
+
+    @api.model
+    def _get_tables(self, exams):
+        """Return ``{exam_id: GradingTable}`` for ``exams`` using one search.
+
+        An exam scheme wins over a course scheme, which wins over a generic
+        one; without any, the built-in default policy applies.  The key
+        ``False`` holds the table for records without an exam.
+        """
+        schemes = self.search([])
+        by_exam = {}
+        by_course = {}
+        generic = None
+        for scheme in schemes:
+            if scheme.exam_id:
+                by_exam.setdefault(scheme.exam_id.id, scheme)
+            elif scheme.course:
+                by_course.setdefault(scheme.course, scheme)
+            elif generic is None:
+                generic = scheme
+
+        default_table = GradingTable(
+            self._default_pass_percentage, self._default_grade_cutoffs, self._default_category_cutoffs
+        )
+        tables = {False: generic._make_table() if generic else default_table}
+        cache = {}
+        for exam in exams:
+            scheme = by_exam.get(exam.id) or by_course.get(exam.course) or generic
+            if not scheme:
+                tables[exam.id] = default_table
+                continue
+            if scheme.id not in cache:
+                cache[scheme.id] = scheme._make_table()
+            tables[exam.id] = cache[scheme.id]
+        return tables
+
+    def _make_table(self):
+        self.ensure_one()
+        grades = [(line.min_percentage, line.grade) for line in self.line_ids if line.kind == 'grade']
+        categories = [(line.min_percentage, line.category) for line in self.line_ids if line.kind == 'category']
+        return GradingTable(
+            self.pass_percentage,
+            grades or self._default_grade_cutoffs,
+            categories or self._default_category_cutoffs,
+        )
+
+    def action_apply_to_results(self):
+        """Regrade the stored results covered by these schemes in one recompute."""
+        exam_domain = []
+        if not any(not scheme.exam_id and not scheme.course for scheme in self):
+            exam_domain = ['|', ('id', 'in', self.exam_id.ids), ('course', 'in', self.mapped('course'))]
+        exams = self.env['exam.planning'].with_context(active_test=False).search(exam_domain)
+
+        ResultLine = self.env['exam.result.line']
+        Result = self.env['exam.result']
+        lines = ResultLine.search([('result_id.exam_id', 'in', exams.ids)])
+        results = Result.search([('exam_id', 'in', exams.ids)])
+        for fname in ('percentage', 'grade'):
+            self.env.add_to_compute(ResultLine._fields[fname], lines)
+        for fname in ('percentage', 'grade', 'result_status', 'category'):
+            self.env.add_to_compute(Result._fields[fname], results)
+        self.env.flush_all()
+
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Results Regraded',
+                'message': f'{len(results)} results regraded.',
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+
+class ExamGradingSchemeLine(models.Model):
+    _name = 'exam.grading.scheme.line'
+    _description = 'Exam Grading Scheme Cut-off'
+    _order = 'kind, min_percentage desc'
+
+    scheme_id = fields.Many2one('exam.grading.scheme', string="Scheme", required=True, ondelete='cascade')
+    kind = fields.Selection([
+        ('grade', 'Grade'),
+        ('category', 'Category'),
+    ], string="Type", required=True, default='grade')
+    min_percentage = fields.Float(string="From Percentage", required=True)
+    grade = fields.Selection(
+        [("A", "A"), ("B", "B"), ("C", "C"), ("D", "D")], string="Grade"
+    )
+    category = fields.Selection([
+        ("distinction", "Distinction"),
+        ("first_class", "First Class (First Division)"),
+        ("second_class", "Second Class (Second Division)"),
+        ("pass_class", "Pass Class (Third Division)"),
+    ], string="Category")
+
+    _sql_constraints = [
+        ('percentage_range', 'CHECK(min_percentage >= 0 AND min_percentage <= 100)',
+         'Cut-offs must be between 0 and 100.'),
+    ]
@@ -4,7 +4,7 @@ class ExamHall(models.Model):
     _name = 'exam.hall'
     _description = 'Exam Hall'
     _order = 'name'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'exam.dashboard.kpi.mixin']
     _rec_name = 'name'
     
     name = fields.Char(string="Hall Name", required=True, tracking=True)
@@ -1,15 +1,16 @@
 from odoo import models, fields, api
-from odoo.exceptions import ValidationError
+from odoo.exceptions import ValidationError, UserError
 from datetime import datetime
 import io
 import base64
+import json
 import xlsxwriter
 
 
 class ExamPlanning(models.Model):
     _name = 'exam.planning'
     _description = 'Exam Planning'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'exam.dashboard.kpi.mixin']
     _rec_name = 'exam_name'
 
     exam_name = fields.Char('Exam Name', required=True, tracking=True)
@@ -68,6 +69,8 @@ class ExamPlanning(models.Model):
     instructions = fields.Text('Instructions', tracking=True)
     registration_deadline = fields.Date('Registration Deadline', required=True, tracking=True)
     active = fields.Boolean('Active', default=True, tracking=True)
+    results_published = fields.Boolean('Results Published', readonly=True, copy=False, tracking=True)
+    results_published_date = fields.Datetime('Results Published On', readonly=True, copy=False)
     state = fields.Selection(
         [
             ("new", "New"),
@@ -87,7 +90,69 @@ class ExamPlanning(models.Model):
         """ Move to Confirmed state """
         for rec in self:
             rec.state = "confirm"
+        self._trigger_admit_card_prerender()
+
+    def action_prerender_admit_cards(self):
+        """Queue the admit cards of confirmed exams for batch rendering."""
+        if any(exam.state != 'confirm' for exam in self):
+            raise UserError("Confirm the exam before rendering its admit cards.")
+        self._trigger_admit_card_prerender()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Admit Cards Queued',
+                'message': 'The admit cards will be rendered in the background.',
+                'type': 'info',
+                'sticky': False,
+            }
+        }
+
+    def _trigger_admit_card_prerender(self):
+        cron = self.env.ref('exam_management.ir_cron_admit_card_prerender', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
             
+    def action_generate_results(self):
+        """Create result sheets for every assigned student of the selected exams."""
+        Result = self.env['exam.result']
+        created = sum(len(Result._generate_for_exam(exam)) for exam in self)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Results Generated',
+                'message': f'{created} result sheets created.',
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+    def action_publish_results(self):
+        """Publish the results and queue their PDFs for batch pre-rendering,
+        so that downloads on publication day are served from the cache."""
+        self.write({'results_published': True, 'results_published_date': fields.Datetime.now()})
+        cron = self.env.ref('exam_management.ir_cron_result_prerender', raise_if_not_found=False)
+        if cron:
+            cron._trigger()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Results Published',
+                'message': 'The result PDFs will be rendered in the background.',
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+    def action_view_merit_list(self):
+        """Bring the ranks of these exams up to date and open their merit list."""
+        self.env['exam.result']._refresh_merit(self)
+        action = self.env['ir.actions.act_window']._for_xml_id('exam_management.action_exam_result_merit')
+        action['domain'] = [('exam_id', 'in', self.ids)]
+        return action
+
     def action_export_excel(self):
         """Export multiple selected exam details into one Excel file."""
         if not self:
@@ -334,6 +399,163 @@ class ExamPlanning(models.Model):
         }
         
 
+    # Records read per query by the streaming export
+    _export_chunk_size = 2000
+
+    def action_export_excel_stream(self):
+        """Download the full workbook (exams, subjects, assignments, seating
+        and results) streamed by the export controller."""
+        if not self:
+            raise ValidationError("Please select at least one exam record to export.")
+        # The selection is kept server side; only the job id goes in the URL
+        job = self.env['bulk.export.job'].create({
+            'res_model': self._name,
+            'res_ids': json.dumps(self.ids),
+            'field_spec': json.dumps([]),
+            'file_format': 'xlsx',
+            'filename': 'Exam_Planning_Export.xlsx',
+        })
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/exam_management/exam_planning/export/{job.id}',
+            'target': 'new',
+        }
+
+    def _iter_export_rows(self, model, fields_list, order='id'):
+        """Yield ``search_read`` rows of ``model`` linked to these exams, one
+        chunk at a time so that the record cache never holds the whole year."""
+        Model = self.env[model]
+        last_id = 0
+        while True:
+            rows = Model.search_read(
+                [('exam_id', 'in', self.ids), ('id', '>', last_id)], fields_list,
+                order='id', limit=self._export_chunk_size,
+            )
+            if not rows:
+                break
+            last_id = rows[-1]['id']
+            yield from rows
+            self.env.invalidate_all()
+
+    def _write_export_workbook(self, fileobj):
+        """Write the multi-sheet export of these exams into ``fileobj``.
+
+        The workbook uses xlsxwriter's ``constant_memory`` mode: rows are
+        flushed to disk as soon as the next row starts, so every sheet is
+        written strictly top to bottom and formats are created once.
+        """
+        workbook = xlsxwriter.Workbook(fileobj, {'constant_memory': True})
+        header_format = workbook.add_format({
+            'bold': True, 'font_color': 'white', 'bg_color': '#4F81BD',
+            'border': 1, 'align': 'center', 'valign': 'vcenter',
+        })
+        text_format = workbook.add_format({'border': 1, 'valign': 'vcenter'})
+        number_format = workbook.add_format({'border': 1, 'num_format': '0.00'})
+        date_format = workbook.add_format({'border': 1, 'num_format': 'dd/mm/yyyy', 'align': 'center'})
+
+        def add_sheet(name, headers, widths):
+            sheet = workbook.add_worksheet(name)
+            for col, width in enumerate(widths):
+                sheet.set_column(col, col, width)
+            sheet.write_row(0, 0, headers, header_format)
+            sheet.freeze_panes(1, 0)
+            return sheet
+
+        def label(fname, model='exam.planning'):
+            return dict(self.env[model]._fields[fname]._description_selection(self.env))
+
+        def name(value):
+            return value[1] if value else ''
+
+        def write_date(sheet, row, col, value):
+            if value:
+                sheet.write_datetime(row, col, datetime.combine(value, datetime.min.time()), date_format)
+            else:
+                sheet.write_blank(row, col, None, text_format)
+
+        courses = label('course')
+        semesters = label('class_semester')
+        states = label('state')
+        codes = {exam.id: exam.exam_code or '' for exam in self}
+
+        # --- Exams ---
+        sheet = add_sheet('Exams', [
+            'Exam Code', 'Exam Name', 'Course', 'Class & Semester', 'Exam Start Date', 'Exam End Date',
+            'Exam Time', 'Duration (Hours)', 'Total Marks', 'Registration Deadline', 'Status',
+        ], [14, 30, 22, 26, 14, 14, 10, 14, 12, 20, 12])
+        for row, exam in enumerate(self.sorted('id'), start=1):
+            sheet.write_row(row, 0, [
+                exam.exam_code or '', exam.exam_name or '', courses.get(exam.course, ''),
+                semesters.get(exam.class_semester, ''),
+            ], text_format)
+            write_date(sheet, row, 4, exam.exam_start_date)
+            write_date(sheet, row, 5, exam.exam_end_date)
+            sheet.write_string(row, 6, self.format_float_time(exam.exam_time), text_format)
+            sheet.write_number(row, 7, exam.duration or 0.0, number_format)
+            sheet.write_number(row, 8, exam.total_marks or 0, text_format)
+            write_date(sheet, row, 9, exam.registration_deadline)
+            sheet.write_string(row, 10, states.get(exam.state, ''), text_format)
+
+        # --- Subjects ---
+        sheet = add_sheet('Subjects', ['Exam Code', 'Subject Name', 'Exam Date', 'Total Marks'], [14, 30, 14, 12])
+        for row, subject in enumerate(
+            self._iter_export_rows('exam.subject', ['exam_id', 'name', 'exam_date', 'total_marks']), start=1
+        ):
+            sheet.write_row(row, 0, [codes.get(subject['exam_id'][0], ''), subject['name'] or ''], text_format)
+            write_date(sheet, row, 2, subject['exam_date'])
+            sheet.write_number(row, 3, subject['total_marks'] or 0, text_format)
+
+        # --- Assignments ---
+        statuses = label('status', 'student.exam.assignment')
+        attendances = label('attendance', 'student.exam.assignment')
+        sheet = add_sheet('Assignments', [
+            'Exam Code', 'Student', 'Subject', 'Assigned On', 'Status', 'Attendance',
+        ], [14, 30, 30, 14, 12, 12])
+        for row, assignment in enumerate(self._iter_export_rows('student.exam.assignment', [
+            'exam_id', 'student_id', 'subject_id', 'assignment_date', 'status', 'attendance',
+        ]), start=1):
+            sheet.write_row(row, 0, [
+                codes.get(assignment['exam_id'][0], ''), name(assignment['student_id']),
+                name(assignment['subject_id']),
+            ], text_format)
+            write_date(sheet, row, 3, assignment['assignment_date'])
+            sheet.write_row(row, 4, [
+                statuses.get(assignment['status'], ''), attendances.get(assignment['attendance'], ''),
+            ], text_format)
+
+        # --- Seating ---
+        sheet = add_sheet('Seating', ['Exam Code', 'Hall', 'Seat Number', 'Student', 'Course'], [14, 20, 12, 30, 22])
+        for row, seat in enumerate(self._iter_export_rows('exam.seating', [
+            'exam_id', 'hall_id', 'seat_number', 'student_id', 'course',
+        ]), start=1):
+            sheet.write_row(row, 0, [codes.get(seat['exam_id'][0], ''), name(seat['hall_id'])], text_format)
+            sheet.write_number(row, 2, seat['seat_number'], text_format)
+            sheet.write_row(row, 3, [name(seat['student_id']), courses.get(seat['course'], '')], text_format)
+
+        # --- Results ---
+        grades = label('grade', 'exam.result')
+        categories = label('category', 'exam.result')
+        results = label('result_status', 'exam.result')
+        sheet = add_sheet('Results', [
+            'Exam Code', 'Student', 'Marks Obtained', 'Total Marks', 'Percentage',
+            'Grade', 'Result Category', 'Result', 'Rank',
+        ], [14, 30, 14, 12, 12, 8, 28, 10, 8])
+        for row, result in enumerate(self._iter_export_rows('exam.result', [
+            'exam_id', 'student_id', 'marks_obtained', 'total_marks', 'percentage',
+            'grade', 'category', 'result_status', 'merit_rank',
+        ]), start=1):
+            sheet.write_row(row, 0, [codes.get(result['exam_id'][0], ''), name(result['student_id'])], text_format)
+            sheet.write_row(row, 2, [
+                result['marks_obtained'], result['total_marks'], result['percentage'],
+            ], number_format)
+            sheet.write_row(row, 5, [
+                grades.get(result['grade'], ''), categories.get(result['category'], ''),
+                results.get(result['result_status'], ''),
+            ], text_format)
+            sheet.write_number(row, 8, result['merit_rank'] or 0, text_format)
+
+        workbook.close()
+
     # Validation for correct date order
     @api.constrains('exam_start_date', 'exam_end_date', 'registration_deadline')
     def _check_dates(self):
@@ -342,6 +564,13 @@ class ExamPlanning(models.Model):
                 raise ValidationError("Exam End Date cannot be earlier than Start Date.")
             if record.registration_deadline >= record.exam_start_date:
                 raise ValidationError("Registration deadline must be before Exam Start Date.")
+
+    # Rescheduling an exam can double book the halls and invigilators of its sittings
+    @api.constrains('exam_time', 'duration', 'exam_start_date', 'exam_end_date')
+    def _check_sitting_clashes(self):
+        sittings = self.env['exam.conducting'].search([('exam_id', 'in', self.ids)])
+        if sittings:
+            sittings._check_schedule_clashes()
             
     @api.model
     def format_float_time(self, float_time):
@@ -0,0 +1,91 @@
+from odoo import models
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class ExamReportCacheMixin(models.AbstractModel):
+    """PDF cache of one QWeb report per record, stored as attachments.
+
+    The attachment name embeds ``_report_cache_key()``, so a record whose
+    printed data changed simply misses the cache.  Batches are rendered with
+    a single wkhtmltopdf call and split per record.
+    """
+    _name = 'exam.report.cache.mixin'
+    _description = 'Cached Report PDFs'
+
+    # To be set by the inheriting models
+    _report_cache_report = None
+    _report_cache_prefix = None
+    # Stored field holding the version of the printed data
+    _report_cache_key_field = 'write_date'
+    # Records rendered per wkhtmltopdf call
+    _report_cache_batch_size = 100
+
+    def _report_cache_key(self):
+        """Version of the printed data of this record."""
+        return str(self[self._report_cache_key_field])
+
+    def _report_cache_name(self):
+        return f"{self._report_cache_prefix}_{self._report_cache_key()}.pdf"
+
+    def _get_report_cache_attachments(self):
+        """Cached report attachments of these records, current or stale."""
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_id', 'in', self.ids),
+            ('name', '=like', f'{self._report_cache_prefix}_%.pdf'),
+        ])
+
+    def _get_stale_report_cache(self):
+        """Records of ``self`` without a current cached PDF."""
+        current = {(att.res_id, att.name) for att in self._get_report_cache_attachments()}
+        return self.filtered(lambda rec: (rec.id, rec._report_cache_name()) not in current)
+
+    def _get_cached_pdf(self):
+        """PDF of this record, rendered and cached on a miss."""
+        self.ensure_one()
+        name = self._report_cache_name()
+        attachment = self._get_report_cache_attachments().filtered(
+            lambda att: att.res_id == self.id and att.name == name
+        )[:1]
+        if not attachment:
+            attachment = self._render_report_cache()[:1]
+        return attachment.raw
+
+    def _render_report_cache(self):
+        """Render these records in one wkhtmltopdf call and store one
+        attachment per record, replacing any stale version."""
+        if not self:
+            return self.env['ir.attachment']
+        Report = self.env['ir.actions.report'].sudo()
+        streams = Report._render_qweb_pdf_prepare_streams(self._report_cache_report, None, res_ids=self.ids)
+        if False in streams:
+            # The merged PDF could not be split per record: fall back to one call each
+            streams = {}
+            for rec in self:
+                streams.update(Report._render_qweb_pdf_prepare_streams(self._report_cache_report, None, res_ids=rec.ids))
+
+        self._get_report_cache_attachments().unlink()
+        vals_list = []
+        for rec in self:
+            stream = streams[rec.id]['stream']
+            vals_list.append({
+                'name': rec._report_cache_name(),
+                'raw': stream.getvalue(),
+                'res_model': self._name,
+                'res_id': rec.id,
+                'mimetype': 'application/pdf',
+            })
+            stream.close()
+        return self.env['ir.attachment'].sudo().create(vals_list)
+
+    def _prerender_report_cache(self):
+        """Render the missing or outdated PDFs of these records batch by
+        batch, committing after each batch.  Returns the number rendered."""
+        pending = self._get_stale_report_cache()
+        for start in range(0, len(pending), self._report_cache_batch_size):
+            pending[start:start + self._report_cache_batch_size]._render_report_cache()
+            self.env.cr.commit()
+            self.env.invalidate_all()
+        return len(pending)
@@ -1,6 +1,8 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError, ValidationError
 
+import hashlib
+import json
 import logging
 _logger = logging.getLogger(__name__)
 
@@ -8,14 +10,20 @@ _logger = logging.getLogger(__name__)
 class ExamResult(models.Model):
     _name = "exam.result"
     _description = "Exam Result"
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'exam.report.cache.mixin']
     _rec_name = 'display_name'
 
+    _report_cache_report = 'exam_management.action_report_exam_result'
+    _report_cache_prefix = 'result'
+    _report_cache_key_field = 'result_hash'
+    # Published results re-checked by the pre-render cron
+    _report_cache_days = 30
+
     exam_id = fields.Many2one(
         "exam.planning", string="Exam", required=True, tracking=True
     )
     student_id = fields.Many2one(
-        "student.registration", string="Student", required=True, tracking=True
+        "student.registration", string="Student", required=True, tracking=True, index=True
     )
 
     subject_line_ids = fields.One2many(
@@ -68,6 +76,20 @@ class ExamResult(models.Model):
     help="Academic classification based on percentage"
 )
 
+    # Merit list, materialized per (exam, course, semester) by _refresh_merit()
+    course = fields.Selection(related="student_id.course", store=True, string="Course")
+    class_semester = fields.Selection(related="student_id.class_semester", store=True, string="Class & Semester")
+    merit_rank = fields.Integer(string="Rank", readonly=True, copy=False)
+    merit_percentile = fields.Float(string="Percentile", readonly=True, copy=False, digits=(5, 2),
+                                    help="Share of the cohort scoring at or below this result")
+    merit_cohort_size = fields.Integer(string="Cohort Size", readonly=True, copy=False)
+    merit_stale = fields.Boolean(string="Rank Outdated", compute="_compute_merit_stale", store=True,
+                                 copy=False, index=True)
+
+    result_hash = fields.Char(string="Result Sheet Version", compute="_compute_result_hash", store=True,
+                              help="Hash of everything printed on the result sheet; a cached PDF is only "
+                                   "served while its name carries the current hash")
+
     @api.depends("student_id.student_name", "exam_id.exam_name")
     def _compute_display_name(self):
         for rec in self:
@@ -82,8 +104,9 @@ class ExamResult(models.Model):
             rec.total_marks = sum(line.total_marks for line in rec.subject_line_ids)
             rec.marks_obtained = sum(line.marks_obtained for line in rec.subject_line_ids)
 
-    @api.depends("marks_obtained", "total_marks", "subject_line_ids.attendance")
+    @api.depends("marks_obtained", "total_marks", "subject_line_ids.attendance", "subject_line_ids.grade")
     def _compute_percentage_and_grade(self):
+        tables = self.env['exam.grading.scheme']._get_tables(self.exam_id)
         for rec in self:
             # Rule: if absent in any subject → auto fail
             if any(line.attendance == "absent" for line in rec.subject_line_ids):
@@ -96,42 +119,127 @@ class ExamResult(models.Model):
                 continue
 
             if rec.total_marks > 0:
+                table = tables.get(rec.exam_id.id, tables[False])
                 rec.percentage = (rec.marks_obtained / rec.total_marks) * 100.0
                 passing = all(line.grade != 'F' for line in rec.subject_line_ids)
 
-                if rec.percentage < 33 or not passing:
+                if not table.is_pass(rec.percentage) or not passing:
                     rec.result_status = "fail"
                     rec.grade = "F"
                     rec.category = "fail"   
                 else:
                     rec.result_status = "pass"
-                    # Grade calculation
-                    if rec.percentage >= 85:
-                        rec.grade = "A"
-                    elif rec.percentage >= 70:
-                        rec.grade = "B"
-                    elif rec.percentage >= 55:
-                        rec.grade = "C"
-                    else:
-                        rec.grade = "D"
-
-                    # Category classification
-                    if rec.percentage >= 75:
-                        rec.category = "distinction"
-                    elif rec.percentage >= 60:
-                        rec.category = "first_class"
-                    elif rec.percentage >= 50:
-                        rec.category = "second_class"
-                    elif rec.percentage >= 40:
-                        rec.category = "pass_class"
-                    else:
-                        rec.category = "fail"  
+                    rec.grade = table.grade(rec.percentage)
+                    rec.category = table.category(rec.percentage)
             else:
                 rec.percentage = 0.0
                 rec.grade = 'F'
                 rec.result_status = 'fail'
                 rec.category = 'fail' 
 
+    @api.depends("percentage", "exam_id", "course", "class_semester")
+    def _compute_merit_stale(self):
+        # Any change of score or cohort invalidates the ranks of the cohort
+        self.merit_stale = True
+
+    # Fields that move a result to another merit cohort
+    _merit_cohort_fields = {'exam_id', 'student_id', 'course', 'class_semester'}
+
+    def write(self, vals):
+        if self._merit_cohort_fields.intersection(vals):
+            self._mark_merit_cohorts_stale()
+        return super().write(vals)
+
+    def unlink(self):
+        self._mark_merit_cohorts_stale()
+        return super().unlink()
+
+    def _mark_merit_cohorts_stale(self):
+        """Flag every result of the current cohorts of ``self`` as stale, so
+        that the cohorts these results leave are re-ranked too."""
+        if not self:
+            return
+        self.flush_model(['exam_id', 'course', 'class_semester', 'merit_stale'])
+        self.env.cr.execute("""
+            UPDATE exam_result r
+               SET merit_stale = TRUE
+              FROM (SELECT DISTINCT exam_id, course, class_semester
+                      FROM exam_result
+                     WHERE id IN %s) cohort
+             WHERE r.exam_id = cohort.exam_id
+               AND r.course IS NOT DISTINCT FROM cohort.course
+               AND r.class_semester IS NOT DISTINCT FROM cohort.class_semester
+               AND NOT r.merit_stale
+        """, [tuple(self.ids)])
+        self.invalidate_model(['merit_stale'])
+
+    @api.depends('student_id.student_name', 'exam_id.exam_name',
+                 'marks_obtained', 'total_marks', 'percentage', 'grade', 'result_status',
+                 'subject_line_ids.subject_id.name', 'subject_line_ids.marks_obtained',
+                 'subject_line_ids.total_marks', 'subject_line_ids.percentage', 'subject_line_ids.grade')
+    def _compute_result_hash(self):
+        for rec in self:
+            content = [
+                rec.id, rec.student_id.student_name, rec.exam_id.exam_name,
+                rec.marks_obtained, rec.total_marks, rec.percentage, rec.grade, rec.result_status,
+                [(line.subject_id.name, line.marks_obtained, line.total_marks, line.percentage, line.grade)
+                 for line in rec.subject_line_ids],
+            ]
+            rec.result_hash = hashlib.sha1(json.dumps(content, default=str).encode()).hexdigest()
+
+    @api.model
+    def _prerender_published_results(self):
+        """Cron entry point: render the missing or outdated result PDFs of the
+        exams published during the last ``_report_cache_days`` days."""
+        exams = self.env['exam.planning'].search([
+            ('results_published', '=', True),
+            ('results_published_date', '>=', fields.Datetime.subtract(fields.Datetime.now(), days=self._report_cache_days)),
+        ])
+        rendered = 0
+        for exam in exams:
+            rendered += self.search([('exam_id', '=', exam.id)], order='id')._prerender_report_cache()
+        _logger.info("Pre-rendered %s result PDFs", rendered)
+        return rendered
+
+    @api.model
+    def _refresh_merit(self, exams=None):
+        """Re-rank the cohorts (exam, course, semester) holding an outdated
+        result, in a single window-function query.  Cohorts without changes
+        keep their stored ranks.  Returns the number of results re-ranked."""
+        self.env.flush_all()
+        exam_clause = "AND exam_id IN %(exam_ids)s" if exams else ""
+        self.env.cr.execute(f"""
+            WITH stale AS (
+                SELECT DISTINCT exam_id, course, class_semester
+                  FROM exam_result
+                 WHERE merit_stale {exam_clause}
+            ), ranked AS (
+                SELECT r.id,
+                       RANK() OVER (PARTITION BY r.exam_id, r.course, r.class_semester
+                                    ORDER BY r.percentage DESC) AS merit_rank,
+                       ROUND((CUME_DIST() OVER (PARTITION BY r.exam_id, r.course, r.class_semester
+                                                ORDER BY r.percentage) * 100)::numeric, 2) AS merit_percentile,
+                       COUNT(*) OVER (PARTITION BY r.exam_id, r.course, r.class_semester) AS merit_cohort_size
+                  FROM exam_result r
+                  JOIN stale s
+                    ON s.exam_id = r.exam_id
+                   AND s.course IS NOT DISTINCT FROM r.course
+                   AND s.class_semester IS NOT DISTINCT FROM r.class_semester
+            )
+            UPDATE exam_result r
+               SET merit_rank = ranked.merit_rank,
+                   merit_percentile = ranked.merit_percentile,
+                   merit_cohort_size = ranked.merit_cohort_size,
+                   merit_stale = FALSE,
+                   write_date = NOW() AT TIME ZONE 'UTC'
+              FROM ranked
+             WHERE r.id = ranked.id
+        """, {'exam_ids': tuple(exams.ids) if exams else ()})
+        count = self.env.cr.rowcount
+        self.invalidate_model(['merit_rank', 'merit_percentile', 'merit_cohort_size', 'merit_stale', 'write_date'])
+        _logger.info("Merit list refreshed: %s results re-ranked", count)
+        return count
+
     @api.onchange("exam_id", "student_id")
     def _onchange_exam_id_student_id(self):
         """
@@ -139,56 +247,80 @@ class ExamResult(models.Model):
         It fetches the attendance status from the exam conducting records.
         """
         if self.exam_id and self.student_id:
+            student_id = self.student_id.id
+            assignments = self.env['student.exam.assignment'].search_read([
+                ('exam_id', '=', self.exam_id.id),
+                ('student_id', '=', student_id)
+            ], ['student_id', 'subject_id', 'attendance'], load=None)
+            attendance_map = self._get_attendance_map(self.exam_id, [student_id])
+            lines_vals = self._prepare_subject_lines(assignments, attendance_map).get(student_id, [])
+
             # Clear existing lines to prevent duplicates
+            self.subject_line_ids = [(5, 0, 0)] + [(0, 0, vals) for vals in lines_vals]
+        else:
             self.subject_line_ids = [(5, 0, 0)]
-            
-            lines_vals = []
-            assignments = self.env['student.exam.assignment'].search([
-                ('exam_id', '=', self.exam_id.id),
-                ('student_id', '=', self.student_id.id)
-            ])
-
-            for assign in assignments:
-                conducting_line = self.env['exam.conducting.line'].search([
-                    ('conducting_id.exam_id', '=', self.exam_id.id),
-                    ('student_id', '=', self.student_id.id),
-                    ('subject_id', '=', assign.subject_id.id),
-                ], limit=1)
-
-                # Debug logging
-                _logger.info(f"Subject: {assign.subject_id.name}")
-                _logger.info(f"Conducting line found: {bool(conducting_line)}")
-                if conducting_line:
-                    _logger.info(f"Conducting line attendance: {conducting_line.attendance}")
-                _logger.info(f"Assignment attendance: {assign.attendance}")
-
-                # Fix: Properly handle the attendance status priority
-                if conducting_line and conducting_line.attendance:
-                    attendance_status = conducting_line.attendance
-                    _logger.info(f"Using conducting line attendance: {attendance_status}")
-                    print(f"attendance_status (from conducting line): {attendance_status}")
-                elif assign.attendance:
-                    attendance_status = assign.attendance
-                    _logger.info(f"Using assignment attendance: {attendance_status}")
-                    print(f"attendance_status check (from assignment): {attendance_status}")
-                else:
-                    attendance_status = 'present'
-                    _logger.info(f"Using default attendance: {attendance_status}")
-                    print(f"attendance_status default: {attendance_status}")
 
-                vals = {
-                    'subject_id': assign.subject_id.id,
-                    'attendance': attendance_status,
-                }
+    @api.model
+    def _get_attendance_map(self, exam, student_ids=None):
+        """Attendance of the exam's conducting lines keyed by (student, subject)."""
+        domain = [('conducting_id.exam_id', '=', exam.id), ('attendance', '!=', False)]
+        if student_ids is not None:
+            domain.append(('student_id', 'in', student_ids))
+        attendance_map = {}
+        for line in self.env['exam.conducting.line'].search_read(
+            domain, ['student_id', 'subject_id', 'attendance'], order='id', load=None
+        ):
+            attendance_map.setdefault((line['student_id'], line['subject_id']), line['attendance'])
+        return attendance_map
 
-                if attendance_status == 'absent':
-                    vals['marks_obtained'] = 0.0
+    @api.model
+    def _prepare_subject_lines(self, assignments, attendance_map):
+        """Subject line values per student id from ``student.exam.assignment``
+        rows (read with ``load=None``).  Attendance comes from the conducting
+        line, then the assignment, and defaults to present."""
+        lines_by_student = {}
+        for assign in assignments:
+            if not assign['subject_id']:
+                continue
+            attendance_status = (
+                attendance_map.get((assign['student_id'], assign['subject_id']))
+                or assign['attendance']
+                or 'present'
+            )
+            vals = {
+                'subject_id': assign['subject_id'],
+                'attendance': attendance_status,
+            }
+            if attendance_status == 'absent':
+                vals['marks_obtained'] = 0.0
+            lines_by_student.setdefault(assign['student_id'], []).append(vals)
+        return lines_by_student
 
-                lines_vals.append((0, 0, vals))
+    @api.model
+    def _generate_for_exam(self, exam):
+        """Create the result sheet of every assigned student of ``exam`` that
+        does not have one yet.  Returns the created results."""
+        assignments = self.env['student.exam.assignment'].search_read(
+            [('exam_id', '=', exam.id)], ['student_id', 'subject_id', 'attendance'], order='id', load=None
+        )
+        existing_students = {
+            result['student_id']
+            for result in self.search_read([('exam_id', '=', exam.id)], ['student_id'], load=None)
+        }
+        lines_by_student = self._prepare_subject_lines(assignments, self._get_attendance_map(exam))
 
-            self.subject_line_ids = lines_vals
-        else:
-            self.subject_line_ids = [(5, 0, 0)]
+        vals_list = [
+            {
+                'exam_id': exam.id,
+                'student_id': student_id,
+                'subject_line_ids': [(0, 0, vals) for vals in lines_vals],
+            }
+            for student_id, lines_vals in lines_by_student.items()
+            if student_id not in existing_students
+        ]
+        results = self.with_context(tracking_disable=True).create(vals_list)
+        _logger.info("Generated %s results for exam %s", len(results), exam.id)
+        return results
 
 
 class ExamResultLine(models.Model):
@@ -196,7 +328,7 @@ class ExamResultLine(models.Model):
     _description = "Exam Result Subject Line"
     _rec_name = 'subject_id'
 
-    result_id = fields.Many2one("exam.result", string="Result", ondelete="cascade", required=True)
+    result_id = fields.Many2one("exam.result", string="Result", ondelete="cascade", required=True, index=True)
     subject_id = fields.Many2one("exam.subject", string="Subject", required=True)
 
     attendance = fields.Selection(
@@ -227,24 +359,17 @@ class ExamResultLine(models.Model):
         readonly=True
     )
 
-    @api.depends("marks_obtained", "total_marks", "attendance")
+    @api.depends("marks_obtained", "total_marks", "attendance", "result_id.exam_id")
     def _compute_percentage_and_grade(self):
+        tables = self.env['exam.grading.scheme']._get_tables(self.result_id.exam_id)
         for line in self:
             if line.attendance == 'absent' or line.total_marks == 0:
                 line.percentage = 0.0
                 line.grade = 'F'
             else:
+                table = tables.get(line.result_id.exam_id.id, tables[False])
                 line.percentage = (line.marks_obtained / line.total_marks) * 100.0
-                if line.percentage < 33:
-                    line.grade = "F"
-                elif line.percentage >= 85:
-                    line.grade = "A"
-                elif line.percentage >= 70:
-                    line.grade = "B"
-                elif line.percentage >= 55:
-                    line.grade = "C"
-                else:
-                    line.grade = "D"
+                line.grade = table.grade(line.percentage)
 
     # @api.onchange('attendance')
     # def _onchange_attendance(self):
@@ -1,15 +1,20 @@
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
+import hashlib
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
 
 class ExamSeating(models.Model):
     _name = 'exam.seating'
     _description = 'Exam Seating'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'exam.dashboard.kpi.mixin', 'exam.report.cache.mixin']
     _rec_name = 'student_id'
 
     exam_id = fields.Many2one('exam.planning', string="Exam", required=True)
     hall_id = fields.Many2one('exam.hall', string="Hall", required=True)
-    student_id = fields.Many2one('student.registration', string="Student", required=True)
+    student_id = fields.Many2one('student.registration', string="Student", required=True, index=True)
     seat_number = fields.Integer("Seat Number", required=True)
     course = fields.Selection([
         ('IT', 'Information Technology'),
@@ -22,19 +27,118 @@ class ExamSeating(models.Model):
         ('CH', 'Chemical'),
     ], string='Course', required=True, tracking=True)
 
-    @api.constrains('exam_id', 'hall_id', 'seat_number')
-    def _check_unique_seat(self):
-        for rec in self:
-            existing = self.search([
-                ('exam_id', '=', rec.exam_id.id),
-                ('hall_id', '=', rec.hall_id.id),
-                ('seat_number', '=', rec.seat_number),
-                ('id', '!=', rec.id)
-            ], limit=1)
-            if existing:
-                raise ValidationError(
-                    f"Seat {rec.seat_number} already exists in hall {rec.hall_id.name} for exam {rec.exam_id.name}."
-                )
+    admit_card_hash = fields.Char(string="Admit Card Version", compute='_compute_admit_card_hash', store=True,
+                                  help="Hash of everything printed on the admit card; a cached PDF is only "
+                                       "served while its name carries the current hash")
+
+    _sql_constraints = [
+        ('unique_exam_hall_seat', 'unique(exam_id, hall_id, seat_number)',
+         'This seat is already taken in this hall for the exam.'),
+        ('unique_exam_student', 'unique(exam_id, student_id)',
+         'This student already has a seat for the exam.'),
+    ]
+
+    _seat_fields = ['exam_id', 'hall_id', 'student_id', 'seat_number']
+
+    _report_cache_report = 'exam_management.action_report_exam_admit_card'
+    _report_cache_prefix = 'admit_card'
+    _report_cache_key_field = 'admit_card_hash'
+
+    @api.depends('seat_number', 'hall_id.name', 'hall_id.location',
+                 'student_id.student_name', 'student_id.student_id',
+                 'exam_id.exam_name', 'exam_id.exam_code', 'exam_id.course', 'exam_id.class_semester',
+                 'exam_id.subject_ids.name', 'exam_id.subject_ids.exam_date')
+    def _compute_admit_card_hash(self):
+        for seat in self:
+            exam = seat.exam_id
+            content = [
+                seat.seat_number, seat.hall_id.name, seat.hall_id.location,
+                seat.student_id.student_name, seat.student_id.student_id,
+                exam.exam_name, exam.exam_code, exam.course, exam.class_semester,
+                [(subject.name, subject.exam_date) for subject in exam.subject_ids],
+            ]
+            seat.admit_card_hash = hashlib.sha1(json.dumps(content, default=str).encode()).hexdigest()
+
+    @api.model
+    def _prerender_admit_cards(self, exams=None):
+        """Render the missing or outdated admit cards of confirmed, upcoming
+        exams in batches, committing after each batch (cron entry point)."""
+        if exams is None:
+            exams = self.env['exam.planning'].search([
+                ('state', '=', 'confirm'),
+                ('exam_end_date', '>=', fields.Date.context_today(self)),
+            ])
+        rendered = 0
+        for exam in exams:
+            rendered += self.search([('exam_id', '=', exam.id)], order='id')._prerender_report_cache()
+        _logger.info("Pre-rendered %s admit cards", rendered)
+        return rendered
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self._check_seat_conflicts(vals_list)
+        return super().create(vals_list)
+
+    def write(self, vals):
+        if any(field in vals for field in self._seat_fields):
+            seats = [{
+                'exam_id': rec.exam_id.id,
+                'hall_id': rec.hall_id.id,
+                'student_id': rec.student_id.id,
+                'seat_number': rec.seat_number,
+                **vals,
+            } for rec in self]
+            self._check_seat_conflicts(seats, exclude_ids=self.ids)
+        return super().write(vals)
+
+    @api.model
+    def _check_seat_conflicts(self, seats, exclude_ids=()):
+        """Validate a batch of seats against each other and the database.
+
+        One query loads the existing seats of the exams involved; every
+        duplicate seat or doubly seated student is collected and reported in
+        a single error.  The SQL constraints still guard concurrent writers.
+        """
+        exam_ids = {seat.get('exam_id') for seat in seats if seat.get('exam_id')}
+        if not exam_ids:
+            return
+
+        taken_seats = set()
+        seated_students = set()
+        for seat in self.search_read(
+            [('exam_id', 'in', list(exam_ids)), ('id', 'not in', list(exclude_ids))],
+            self._seat_fields, load=None
+        ):
+            taken_seats.add((seat['exam_id'], seat['hall_id'], seat['seat_number']))
+            seated_students.add((seat['exam_id'], seat['student_id']))
+
+        conflicts = []
+        for seat in seats:
+            seat_key = (seat.get('exam_id'), seat.get('hall_id'), seat.get('seat_number'))
+            student_key = (seat.get('exam_id'), seat.get('student_id'))
+            if seat_key in taken_seats:
+                conflicts.append(('seat', seat))
+            if student_key in seated_students:
+                conflicts.append(('student', seat))
+            taken_seats.add(seat_key)
+            seated_students.add(student_key)
+
+        if conflicts:
+            exams = self.env['exam.planning'].browse(exam_ids)
+            halls = self.env['exam.hall'].browse({seat.get('hall_id') for _kind, seat in conflicts} - {False, None})
+            students = self.env['student.registration'].browse({seat.get('student_id') for _kind, seat in conflicts} - {False, None})
+            exam_names = dict(zip(exams.ids, exams.mapped('exam_name')))
+            hall_names = dict(zip(halls.ids, halls.mapped('name')))
+            student_names = dict(zip(students.ids, students.mapped('student_name')))
+            lines = [
+                f"Seat {seat.get('seat_number')} in hall {hall_names.get(seat.get('hall_id'))} "
+                f"is already taken for exam {exam_names.get(seat.get('exam_id'))}."
+                if kind == 'seat' else
+                f"{student_names.get(seat.get('student_id'))} already has a seat "
+                f"for exam {exam_names.get(seat.get('exam_id'))}."
+                for kind, seat in conflicts
+            ]
+            raise ValidationError("\n".join(lines))
 
     def name_get(self):
         result = []
@@ -0,0 +1,94 @@
+from odoo import models, fields, api
+from dateutil.relativedelta import relativedelta
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+class MailMail(models.Model):
+    _inherit = 'mail.mail'
+
+    # Outbound mail of these models is queued and drained by the exam mail cron
+    _exam_mail_models = ('student.registration', 'student.exam.assignment', 'exam.conducting')
+    # Mails sent over one SMTP connection
+    _exam_mail_batch_size = 50
+    # Mails sent per cron run; the cron runs every minute
+    _exam_mail_rate_limit = 200
+    _exam_mail_max_retries = 3
+    # Failures that a retry cannot fix
+    _exam_mail_permanent_failures = ('mail_email_invalid', 'mail_email_missing', 'mail_from_invalid', 'mail_from_missing')
+
+    exam_retry_count = fields.Integer(string="Retries", default=0, copy=False)
+
+    @api.model
+    def _trigger_exam_mail_queue(self, delayed=False):
+        """Wake up the exam mail cron now, or after one cron interval when
+        ``delayed`` (used once the rate limit is reached)."""
+        cron = self.env.ref('exam_management.ir_cron_exam_mail_queue', raise_if_not_found=False)
+        if not cron:
+            return
+        if delayed:
+            cron._trigger(at=fields.Datetime.now() + relativedelta(**{cron.interval_type: cron.interval_number}))
+        else:
+            cron._trigger()
+
+    @api.model
+    def process_email_queue(self, ids=None, **kwargs):
+        """Leave exam mails to the exam mail cron and its rate limit."""
+        filters = list(self.env.context.get('filters') or []) + [('model', 'not in', self._exam_mail_models)]
+        return super(MailMail, self.with_context(filters=filters)).process_email_queue(ids=ids, **kwargs)
+
+    @api.model
+    def _process_exam_mail_queue(self):
+        """Cron entry point: requeue transient failures, then send the queued
+        exam mails batch by batch, one SMTP connection per batch."""
+        failed = self.search([
+            ('model', 'in', self._exam_mail_models),
+            ('state', '=', 'exception'),
+            ('exam_retry_count', '<', self._exam_mail_max_retries),
+            ('failure_type', 'not in', self._exam_mail_permanent_failures),
+        ])
+        for mail in failed:
+            mail.write({'state': 'outgoing', 'exam_retry_count': mail.exam_retry_count + 1})
+        self.env.cr.commit()
+
+        sent = 0
+        while sent < self._exam_mail_rate_limit:
+            batch = self._lock_exam_mail_batch(min(self._exam_mail_batch_size, self._exam_mail_rate_limit - sent))
+            if not batch:
+                break
+            # send() opens one SMTP session per mail server for the whole batch;
+            # it commits after each mail, which releases the row locks early
+            batch.send(auto_commit=True)
+            sent += len(batch)
+            self.env.invalidate_all()
+
+        if sent:
+            _logger.info("Exam mail queue: %s mails processed, %s requeued", sent, len(failed))
+            if sent >= self._exam_mail_rate_limit:
+                # Rate limit reached: continue after one cron interval
+                self._trigger_exam_mail_queue(delayed=True)
+        return True
+
+    def _lock_exam_mail_batch(self, limit):
+        """Select up to ``limit`` due outgoing exam mails, skipping rows
+        locked by another transaction.
+
+        The locks only last until ``send()`` commits its first mail.  Mails
+        are not sent twice because exam mails are only sent by this cron,
+        which Odoo never runs twice at the same time, and the core mail
+        queue skips them (see ``process_email_queue``).
+        """
+        self.flush_model()
+        self.env.cr.execute("""
+            SELECT mail.id
+              FROM mail_mail mail
+              JOIN mail_message message ON message.id = mail.mail_message_id
+             WHERE mail.state = 'outgoing'
+               AND message.model IN %s
+               AND (mail.scheduled_date IS NULL OR mail.scheduled_date <= (now() at time zone 'UTC'))
+          ORDER BY mail.id
+             LIMIT %s
+               FOR UPDATE OF mail SKIP LOCKED
+        """, [self._exam_mail_models, limit])
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
@@ -2,6 +2,7 @@ from odoo import models, fields, api
 from datetime import date, timedelta
 from odoo.exceptions import ValidationError, UserError
 import logging
+import time
 
 _logger = logging.getLogger(__name__)
 
@@ -11,7 +12,8 @@ class StudentExamAssignment(models.Model):
     _inherit = ['mail.thread', 'mail.activity.mixin']
     _rec_name = 'exam_id'
 
-    student_id = fields.Many2one('student.registration', string="Student", ondelete='cascade', tracking=True, required=True)
+    student_id = fields.Many2one('student.registration', string="Student", ondelete='cascade', tracking=True, required=True,
+                                 index=True)
     exam_id = fields.Many2one('exam.planning', string="Exam",tracking=True, required=True)
     subject_id = fields.Many2one('exam.subject', string="Subject", tracking=True)
 
@@ -42,75 +44,203 @@ class StudentExamAssignment(models.Model):
       
     )
 
+    # Students whose reminders are created and committed together
+    _reminder_chunk_size = 1000
+
     _sql_constraints = [
         ('unique_student_exam_subject', 'unique(student_id, exam_id, subject_id)', 
          'Student already assigned to this subject in exam!')
     ]
-    
+
+    @api.model
+    def _assign_students_to_exam(self, exam, students):
+        """Assign every subject of ``exam`` to ``students`` in one batch.
+
+        Existing (student, subject) pairs for the exam are loaded with a single
+        query, and only the missing ones are created through one batched
+        ``create``.  Returns a dict with ``created``, ``skipped`` and
+        ``elapsed`` (seconds).
+        """
+        start = time.monotonic()
+        subjects = exam.subject_ids
+        existing = {
+            (row['student_id'], row['subject_id'])
+            for row in self.search_read(
+                [('exam_id', '=', exam.id), ('student_id', 'in', students.ids)],
+                ['student_id', 'subject_id'],
+                load=None,
+            )
+        }
+
+        today = date.today()
+        vals_list = [
+            {
+                'student_id': student_id,
+                'exam_id': exam.id,
+                'subject_id': subject_id,
+                'assignment_date': today,
+            }
+            for student_id in students.ids
+            for subject_id in subjects.ids
+            if (student_id, subject_id) not in existing
+        ]
+        if vals_list:
+            self.with_context(tracking_disable=True).create(vals_list)
+
+        stats = {
+            'created': len(vals_list),
+            'skipped': len(students) * len(subjects) - len(vals_list),
+            'elapsed': time.monotonic() - start,
+        }
+        _logger.info(
+            "Exam %s assigned: %s created, %s skipped in %.2fs",
+            exam.id, stats['created'], stats['skipped'], stats['elapsed']
+        )
+        return stats
+
     
     @api.model
     def send_exam_reminder_email(self):
-        """Send reminder email to students one day before the exam"""
+        """Send one digest email per student one day before their exams.
+
+        Tomorrow's exams, subjects, halls and seats are prefetched in a few
+        grouped queries; each digest is rendered once from that data and the
+        mails are created in bulk, chunk by chunk.  The last student handled
+        is committed with each chunk, so a restarted run resumes where it
+        stopped instead of sending duplicates.
+        """
         tomorrow = date.today() + timedelta(days=1)
-        
         _logger.info(f"Running exam reminder for date: {tomorrow}")
 
-        # Find all exams scheduled for tomorrow
-        exam_planning = self.env['exam.planning'].search([
-            ('exam_start_date', '=', tomorrow)
-        ])
-        
-        if not exam_planning:
-            _logger.info("No exams scheduled for tomorrow")
-            return True
-        
-        _logger.info(f"Found {len(exam_planning)} exams for tomorrow: {exam_planning.mapped('exam_name')}")
-        
-        # Find all exam assignments for those exams
-        assignments = self.search([
-            ('exam_id', 'in', exam_planning.ids)
-        ])
-        
-        if not assignments:
-            _logger.info("No exam assignments found for tomorrow's exams")
+        run = self.env['exam.reminder.run']._get_run(tomorrow)
+        if run.state == 'done':
+            _logger.info("Exam reminders for %s already sent", tomorrow)
             return True
-        
-        _logger.info(f"Found {len(assignments)} exam assignments for tomorrow's exams")
-        
-        # Group assignments by student to send one email per student
-        students_exams = {}
-        for assignment in assignments:
-            student = assignment.student_id
-            if student and student.email:
-                students_exams.setdefault(student.id, {
-                    'student': student,
-                    'assignments': []
-                })['assignments'].append(assignment)
-        
-        _logger.info(f"Sending reminders to {len(students_exams)} unique students")
-        
-        # --- Send Email ---
-        template = self.env.ref('exam_management.mail_template_exam_reminder_assignment', raise_if_not_found=False)
-
-        if not template:
-            _logger.warning("Email template 'exam_management.mail_template_exam_reminder_assignment' not found.")
+
+        exams = self._prefetch_reminder_exams(tomorrow)
+        if not exams:
+            _logger.info("No exams scheduled for tomorrow")
+            run.write({'state': 'done'})
             return True
 
-        for data in students_exams.values():
-            student = data['student']
-            assignments = data['assignments']
-            example_assignment = assignments[0]  # template needs a record
-
-            # Send the mail using the template
-            mail_id = template.send_mail(example_assignment.id, force_send=True)
-            _logger.info(f"Reminder email sent to {student.student_name} ({student.email})")
-
-            # Log in chatter
-            example_assignment.message_post(
-                body=f"Exam reminder email sent to <b>{student.student_name}</b> ({student.email}) for tomorrow's exam(s).",
-                subject="Exam Reminder",
-                message_type="notification",
-                subtype_xmlid="mail.mt_comment",
+        # (student, exam) -> subject ids, in one query over tomorrow's assignments
+        subjects_by_student = {}
+        for row in self.search_read(
+            [('exam_id', 'in', list(exams)), ('student_id', '>', run.last_student_id)],
+            ['student_id', 'exam_id', 'subject_id'], order='student_id, id', load=None
+        ):
+            subjects_by_student.setdefault(row['student_id'], {}).setdefault(row['exam_id'], []).append(row['subject_id'])
+
+        _logger.info(f"Sending reminders to {len(subjects_by_student)} unique students")
+
+        student_ids = list(subjects_by_student)
+        Mail = self.env['mail.mail'].sudo()
+        email_from = self.env.user.email or 'noreply@college.com'
+        for start in range(0, len(student_ids), self._reminder_chunk_size):
+            chunk = student_ids[start:start + self._reminder_chunk_size]
+            students = self.env['student.registration'].search_read(
+                [('id', 'in', chunk), ('email', '!=', False)], ['student_name', 'email']
             )
+            vals_list = []
+            for student in students:
+                digest = []
+                for exam_id, subject_ids in subjects_by_student[student['id']].items():
+                    exam = exams[exam_id]
+                    digest.append({
+                        **exam['info'],
+                        'subjects': [exam['subjects'][sid] for sid in subject_ids if sid in exam['subjects']],
+                        'seat': exam['seats'].get(student['id']),
+                    })
+                vals_list.append({
+                    'subject': "Exam Reminder: Tomorrow's Exam - " + ", ".join(exam['name'] for exam in digest),
+                    'body_html': self.env['ir.qweb']._render('exam_management.exam_reminder_digest', {
+                        'student_name': student['student_name'],
+                        'exams': digest,
+                    }),
+                    'email_from': email_from,
+                    'email_to': student['email'],
+                    'model': 'student.registration',
+                    'res_id': student['id'],
+                    'auto_delete': True,
+                })
+            Mail.create(vals_list)
+            # The mails and the checkpoint are committed together
+            run.write({'last_student_id': chunk[-1], 'sent_count': run.sent_count + len(vals_list)})
+            self.env.cr.commit()
+            self.env['mail.mail']._trigger_exam_mail_queue()
 
+        run.write({'state': 'done'})
+        _logger.info("Exam reminders for %s: %s mails queued", tomorrow, run.sent_count)
         return True
+
+    @api.model
+    def _prefetch_reminder_exams(self, exam_date):
+        """Exams on ``exam_date`` keyed by id: printable ``info``, ``subjects``
+        by id and the hall and seat of every seated student in ``seats``."""
+        courses = dict(self.env['exam.planning']._fields['course']._description_selection(self.env))
+        exams = {
+            exam['id']: {
+                'info': {
+                    'name': exam['exam_name'] or 'N/A',
+                    'date': exam['exam_start_date'],
+                    'time': self.env['exam.planning'].format_float_time(exam['exam_time'] or 0.0),
+                    'duration': exam['duration'] or 0,
+                    'course': courses.get(exam['course'], 'N/A'),
+                },
+                'subjects': {},
+                'seats': {},
+            }
+            for exam in self.env['exam.planning'].search_read(
+                [('exam_start_date', '=', exam_date)],
+                ['exam_name', 'exam_start_date', 'exam_time', 'duration', 'course']
+            )
+        }
+        if not exams:
+            return exams
+
+        for subject in self.env['exam.subject'].search_read(
+            [('exam_id', 'in', list(exams))], ['exam_id', 'name', 'total_marks'], load=None
+        ):
+            exams[subject['exam_id']]['subjects'][subject['id']] = (subject['name'], subject['total_marks'])
+
+        seats = self.env['exam.seating'].search_read(
+            [('exam_id', 'in', list(exams))], ['exam_id', 'student_id', 'hall_id', 'seat_number'], load=None
+        )
+        halls = {
+            hall['id']: hall
+            for hall in self.env['exam.hall'].search_read(
+                [('id', 'in', list({seat['hall_id'] for seat in seats}))], ['name', 'location']
+            )
+        }
+        for seat in seats:
+            hall = halls.get(seat['hall_id'], {})
+            exams[seat['exam_id']]['seats'][seat['student_id']] = {
+                'hall': hall.get('name'),
+                'location': hall.get('location'),
+                'seat': seat['seat_number'],
+            }
+        return exams
+
+
+class ExamReminderRun(models.Model):
+    _name = 'exam.reminder.run'
+    _description = 'Exam Reminder Run'
+    _order = 'reminder_date desc'
+    _rec_name = 'reminder_date'
+
+    reminder_date = fields.Date(string="Exam Date", required=True, readonly=True)
+    state = fields.Selection([
+        ('running', 'Running'),
+        ('done', 'Done'),
+    ], string="Status", default='running', required=True, readonly=True)
+    last_student_id = fields.Integer(string="Last Student", default=0, readonly=True,
+                                     help="Resume cursor: students with a higher id have not been reminded yet")
+    sent_count = fields.Integer(string="Reminders Queued", readonly=True)
+
+    _sql_constraints = [
+        ('unique_reminder_date', 'unique(reminder_date)', 'Only one reminder run per exam date.'),
+    ]
+
+    @api.model
+    def _get_run(self, reminder_date):
+        return self.search([('reminder_date', '=', reminder_date)], limit=1) or self.create({'reminder_date': reminder_date})
@@ -1,27 +1,25 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
+from odoo.tools import SQL
 from datetime import date, timedelta
 from odoo.exceptions import ValidationError, UserError
 import logging
-import io
-import base64
-import xlsxwriter
 
 _logger = logging.getLogger(__name__)
 
 class StudentRegistration(models.Model):
     _name = 'student.registration'
     _description = 'Student Registration'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'exam.dashboard.kpi.mixin']
     _rec_name = 'student_name'
    
 
-    student_name = fields.Char(string='Student Name', required=True, tracking=True)
+    student_name = fields.Char(string='Student Name', required=True, tracking=True, index='trigram')
     student_id = fields.Char(
         string='Enrollment ID',
         required=True,
         copy=False,
         readonly=True,
-        index=True,
+        index='trigram',
         default='New'
     )
     exam_id = fields.Many2one('exam.planning', string="Exam", required=False, tracking=True)
@@ -68,7 +66,7 @@ class StudentRegistration(models.Model):
         ('pass', 'Pass'),
         ('fail', 'Fail'),
         ('na', 'Not Attempted'),
-    ], string="Result", compute="_compute_pass_fail", store=True)
+    ], string="Result", compute="_compute_pass_fail", store=True, index=True)
 
     @api.depends('marks_obtained', 'status')
     def _compute_pass_fail(self):
@@ -80,7 +78,7 @@ class StudentRegistration(models.Model):
             else:
                 rec.pass_fail = 'fail'
     
-    email = fields.Char(string='Email', required=True, tracking=True)
+    email = fields.Char(string='Email', required=True, tracking=True, index='trigram')
     phone = fields.Char(string='Phone Number', tracking=True)
     user_id = fields.Many2one(
     'res.users',
@@ -99,73 +97,157 @@ class StudentRegistration(models.Model):
         ('unique_student_id', 'unique(student_id)', 'Enrollment ID must be unique.'),
     ]
     
-    def action_export_excel(self):
-        """Export the current job application record to Excel (row-wise table)"""
-        self.ensure_one()
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-        sheet = workbook.add_worksheet('Job Application')
+    # Columns of the student export: (field name, header)
+    _export_field_spec = [
+        ('student_name', 'Student Name'),
+        ('student_id', 'Enrollment no.'),
+        ('email', 'Email'),
+        ('phone', 'Phone'),
+        ('class_semester', 'Class & Semester'),
+        ('course', 'Course'),
+    ]
 
-        # Define formats
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#D3D3D3',
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        text_format = workbook.add_format({'border': 1})
+    @api.model
+    def _estimate_count(self, domain, exact_limit=1000):
+        """Return ``(count, exact)`` for ``domain``.
 
-        # Data mapping (field order matters here)
-        headers = [
-            'Student Name', 'Enrollment no.', 'Email',
-            'Phone', 'Class & Semester', 'Course'
-        ]
-        values = [
-            self.student_name or '',
-            self.student_id or '',
-            self.email or '',
-            self.phone or '',
-            self.class_semester or '',
-            self.course or '',
-           
-        ]
+        Up to ``exact_limit`` records are counted exactly; beyond that the
+        planner's row estimate is used, so large result sets are never
+        scanned just to print a total.
+        """
+        count = self.search_count(domain, limit=exact_limit + 1)
+        if count <= exact_limit:
+            return count, True
+        query = self._search(domain)
+        self.env.cr.execute(SQL("EXPLAIN (FORMAT JSON) %s", query.select()))
+        plan = self.env.cr.fetchone()[0]
+        return max(int(plan[0]['Plan']['Plan Rows']), count), False
 
-        # Write headers in row 0
-        for col, header in enumerate(headers):
-            sheet.write(0, col, header, header_format)
+    def _get_portal_dashboard_data(self):
+        """Exam history of the student for the portal dashboard as plain dicts.
 
-        # Write values in row 1
-        for col, value in enumerate(values):
-            sheet.write(1, col, value, text_format)
+        Assignments, seats, results and result lines are read with a fixed
+        number of queries regardless of how many semesters the student has.
+        The result is cached per student and per version of their exam data,
+        so a stale entry is simply never looked up again, in any worker.
+        """
+        self.ensure_one()
+        return self._get_cached_portal_dashboard_data(self.id, self._get_portal_dashboard_version())
 
-        # Auto adjust column widths based on header length
-        for col, header in enumerate(headers):
-            column_width = max(len(str(header)), len(str(values[col]))) + 5
-            sheet.set_column(col, col, column_width)
+    @api.model
+    @tools.ormcache('student_id', 'version')
+    def _get_cached_portal_dashboard_data(self, student_id, version):
+        return self.browse(student_id).sudo()._load_portal_dashboard_data()
 
-        workbook.close()
-        output.seek(0)
-        excel_data = output.read()
-        output.close()
+    def _get_portal_dashboard_version(self):
+        """Version stamp of the dashboard data, in one query.
 
-        # Create attachment
-        attachment = self.env['ir.attachment'].create({
-            'name': f'{self.student_name}_application.xlsx',
-            'type': 'binary',
-            'datas': base64.b64encode(excel_data),
-            'res_model': 'student.registration',
-            'res_id': self.id,
-            'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        })
+        Counts catch deletions and the latest write dates catch edits,
+        including stored recomputes and the merit refresh which both update
+        ``write_date``; exams, subjects and halls are stamped too since their
+        names and schedules are shown.
+        """
+        self.ensure_one()
+        for model in ('student.exam.assignment', 'exam.seating', 'exam.result', 'exam.result.line',
+                      'exam.planning', 'exam.subject', 'exam.hall'):
+            self.env[model].flush_model()
+        self.env.cr.execute("""
+            WITH assignment AS (
+                SELECT exam_id, subject_id, write_date FROM student_exam_assignment WHERE student_id = %(student)s
+            ), seat AS (
+                SELECT hall_id, write_date FROM exam_seating WHERE student_id = %(student)s
+            ), result AS (
+                SELECT id, write_date FROM exam_result WHERE student_id = %(student)s
+            )
+            SELECT (SELECT COUNT(*) || '/' || COALESCE(MAX(write_date)::text, '') FROM assignment),
+                   (SELECT COUNT(*) || '/' || COALESCE(MAX(write_date)::text, '') FROM seat),
+                   (SELECT COUNT(*) || '/' || COALESCE(MAX(write_date)::text, '') FROM result),
+                   (SELECT COUNT(*) || '/' || COALESCE(MAX(line.write_date)::text, '')
+                      FROM exam_result_line line WHERE line.result_id IN (SELECT id FROM result)),
+                   (SELECT MAX(write_date)::text FROM exam_planning WHERE id IN (SELECT exam_id FROM assignment)),
+                   (SELECT MAX(write_date)::text FROM exam_subject
+                     WHERE id IN (SELECT subject_id FROM assignment)
+                        OR id IN (SELECT subject_id FROM exam_result_line
+                                   WHERE result_id IN (SELECT id FROM result))),
+                   (SELECT MAX(write_date)::text FROM exam_hall WHERE id IN (SELECT hall_id FROM seat))
+        """, {'student': self.id})
+        return '|'.join(str(value) for value in self.env.cr.fetchone())
+
+    def _load_portal_dashboard_data(self):
+        env = self.env
+        assignments = env['student.exam.assignment'].search_read(
+            [('student_id', '=', self.id)], ['exam_id', 'subject_id'], order='id', load=None
+        )
+        seats = env['exam.seating'].search_read(
+            [('student_id', '=', self.id)], ['exam_id', 'hall_id', 'seat_number'], load=None
+        )
+        # Only results of exams the student is assigned to are shown
+        results = env['exam.result'].search_read(
+            [('student_id', '=', self.id), ('exam_id', 'in', list({row['exam_id'] for row in assignments}))],
+            ['exam_id', 'result_status', 'marks_obtained', 'total_marks', 'percentage', 'grade',
+             'merit_rank', 'merit_cohort_size', 'merit_percentile'],
+            order='id', load=None,
+        )
+        lines = env['exam.result.line'].search_read(
+            [('result_id', 'in', [result['id'] for result in results])],
+            ['result_id', 'subject_id', 'marks_obtained', 'total_marks', 'percentage', 'grade'],
+            order='id', load=None,
+        )
+
+        exam_ids = {row['exam_id'] for row in assignments + seats + results if row['exam_id']}
+        exams = {
+            exam['id']: exam for exam in env['exam.planning'].with_context(active_test=False).search_read(
+                [('id', 'in', list(exam_ids))], ['exam_name', 'exam_time', 'duration']
+            )
+        }
+        subject_ids = {row['subject_id'] for row in assignments + lines if row['subject_id']}
+        subjects = {
+            subject['id']: subject for subject in env['exam.subject'].search_read(
+                [('id', 'in', list(subject_ids))], ['name', 'exam_date']
+            )
+        }
+        halls = {
+            hall['id']: hall['name'] for hall in env['exam.hall'].search_read(
+                [('id', 'in', list({seat['hall_id'] for seat in seats if seat['hall_id']}))], ['name']
+            )
+        }
+
+        seat_by_exam = {
+            seat['exam_id']: {'hall': halls.get(seat['hall_id'], ''), 'seat_number': seat['seat_number']}
+            for seat in seats
+        }
+        lines_by_result = {}
+        for line in lines:
+            subject = subjects.get(line['subject_id'], {})
+            lines_by_result.setdefault(line['result_id'], []).append({
+                'subject_name': subject.get('name', ''),
+                'marks_obtained': line['marks_obtained'],
+                'total_marks': line['total_marks'],
+                'percentage': line['percentage'],
+                'grade': line['grade'],
+            })
 
-        # Return as downloadable file
         return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'new',
+            'assignments': [{
+                'exam_id': assignment['exam_id'],
+                'exam_name': exams.get(assignment['exam_id'], {}).get('exam_name', ''),
+                'exam_time': exams.get(assignment['exam_id'], {}).get('exam_time'),
+                'duration': exams.get(assignment['exam_id'], {}).get('duration'),
+                'subject_name': subjects.get(assignment['subject_id'], {}).get('name', ''),
+                'exam_date': subjects.get(assignment['subject_id'], {}).get('exam_date'),
+                'seat': seat_by_exam.get(assignment['exam_id']),
+            } for assignment in assignments],
+            'results': [dict(
+                result,
+                exam_name=exams.get(result['exam_id'], {}).get('exam_name', ''),
+                lines=lines_by_result.get(result['id'], []),
+            ) for result in results],
         }
 
+    def action_export_excel(self):
+        """Export the selected students to Excel, streamed by the bulk export service"""
+        return self.env['bulk.export.job']._start(self, self._export_field_spec, 'xlsx', 'Students')
+
     @api.depends_context('uid')
     def _compute_student_count(self):
         # Count confirmed and cancelled students separately
@@ -195,15 +277,16 @@ class StudentRegistration(models.Model):
             rec.state = 'confirm'
 
     def action_cancel(self):
+        # Fetch the mail template
+        template = self.env.ref('exam_management.mail_template_student_registration_fail', raise_if_not_found=False)
         for rec in self:
             rec.state = 'cancel'
-            # Fetch the mail template
-            template = self.env.ref('exam_management.mail_template_student_registration_fail', raise_if_not_found=False)
             if template:
-                # Send email to the student
-                template.send_mail(rec.id, force_send=True)
+                # Queue the email to the student
+                template.send_mail(rec.id)
             else:
                 _logger.warning("Email template not found: exam_management.mail_template_student_registration_fail")
+        self.env['mail.mail']._trigger_exam_mail_queue()
     
     def action_send_test_email(self):
             """Manual trigger to test email sending"""
@@ -214,7 +297,8 @@ class StudentRegistration(models.Model):
             if not template:
                 raise UserError("Email template not found. Please check XML ID.")
             for record in self:
-                template.send_mail(record.id, force_send=True)
+                template.send_mail(record.id)
+            self.env['mail.mail']._trigger_exam_mail_queue()
                 
     def action_view_total_students(self):
         return self.env.ref('exam_management.action_student_registration').read()[0]
@@ -225,6 +309,11 @@ class StudentRegistration(models.Model):
     def action_view_cancelled_students(self):
         return self.env.ref('exam_management.action_student_registration_cancelled').read()[0]
 
+    def write(self, vals):
+        if {'course', 'class_semester'}.intersection(vals):
+            # The results leave their merit cohort: have it re-ranked
+            self.env['exam.result'].sudo().search([('student_id', 'in', self.ids)])._mark_merit_cohorts_stale()
+        return super().write(vals)
 
     @api.model
     def create(self, vals):
@@ -260,9 +349,10 @@ class StudentRegistration(models.Model):
                 raise_if_not_found=False
             )
             if template:
-                template.send_mail(record.id, force_send=True)
+                template.send_mail(record.id)
                 record.message_post_with_template(template.id)
-                _logger.info("Registration email sent to %s and logged in chatter", record.email)
+                self.env['mail.mail']._trigger_exam_mail_queue()
+                _logger.info("Registration email queued for %s and logged in chatter", record.email)
             else:
                 _logger.warning("Email template not found for student registration")
         except Exception as e:
@@ -3,7 +3,10 @@
 import { registry } from "@web/core/registry";
 import { FormController } from "@web/views/form/form_controller";
 import { useService } from "@web/core/utils/hooks";
-import { onMounted } from "@odoo/owl";
+import { escape } from "@web/core/utils/strings";
+import { onMounted, useEffect } from "@odoo/owl";
+
+const DASHBOARD_DATA_URL = "/exam_management/dashboard/data";
 
 // Debug: Log that the module is loading
 console.log("Exam Dashboard JavaScript module is loading...");
@@ -195,6 +198,114 @@ if (typeof window !== 'undefined' && !window.printDashboardToPDF) {
     window.printDashboardToPDF = printDashboardToPDF;
 }
 
+// ---------------------------------------------------------------------------
+// Table rendering from the compact rows of /exam_management/dashboard/data
+// ---------------------------------------------------------------------------
+
+function renderEmpty(message) {
+    return `<div class="text-center py-4"><p>${escape(message)}</p></div>`;
+}
+
+function renderTable(headers, rows, tableClass = "table table-striped mb-0") {
+    return `
+        <div class="table-responsive">
+            <table class="${tableClass}">
+                <thead class="table-light">
+                    <tr>${headers.map(h => `<th>${escape(h)}</th>`).join("")}</tr>
+                </thead>
+                <tbody>${rows.join("")}</tbody>
+            </table>
+        </div>`;
+}
+
+function recordUrl(model, id) {
+    return `/web#id=${id}&model=${model}&view_type=form`;
+}
+
+function renderUpcomingExams(rows) {
+    if (!rows.length) {
+        return renderEmpty("No Upcoming Exams");
+    }
+    const body = rows.map(([id, name, code, date, time, course, semester]) => `
+        <tr class="exam-row">
+            <td>${escape(name)}<br/><small class="text-muted">${escape(code)}</small></td>
+            <td>${escape(date)}<br/><small class="text-muted">${escape(time)}</small></td>
+            <td>${escape(course)}<br/><small>${escape(semester)}</small></td>
+            <td>
+                <a href="${recordUrl("exam.planning", id)}" role="button" class="btn btn-primary btn-sm exam-detail-btn" data-exam-id="${id}">
+                    <i class="fa fa-eye"></i> Course Info
+                </a>
+            </td>
+        </tr>`);
+    return renderTable(["Exam Details", "Date & Time", "Course Info", "Action"], body,
+        "table table-striped table-hover mb-0");
+}
+
+function renderExamsToday(rows) {
+    if (!rows.length) {
+        return renderEmpty("No Exams Scheduled Today");
+    }
+    const body = rows.map(([id, name, code, time, halls, course, semester]) => `
+        <tr class="exam-row">
+            <td>
+                <a href="${recordUrl("exam.planning", id)}" role="button" class="btn btn-sm btn-outline-primary exam-detail-btn" data-exam-id="${id}">
+                    <i class="fa fa-eye"></i> ${escape(name)}
+                </a>
+                <br/><small class="text-muted">${escape(code)}</small>
+            </td>
+            <td>${escape(time)}</td>
+            <td>${escape(halls)}</td>
+            <td><small>${escape(course)}<br/>${escape(semester)}</small></td>
+        </tr>`);
+    return renderTable(["Exam Details", "Time", "Hall", "Course Info"], body);
+}
+
+function renderUnassignedStudents(rows) {
+    const headers = ["Student Name", "Course", "Semester", "Registration Status", "Status", "Action"];
+    const sections = [
+        { state: "confirm", title: "Confirmed Registrations", color: "success", badge: "Confirmed" },
+        { state: "cancel", title: "Cancelled Registrations", color: "danger", badge: "Cancelled" },
+    ];
+    const html = sections.map(section => {
+        const body = rows.filter(row => row[4] === section.state).map(([id, name, course, semester, state, noExam]) => `
+            <tr class="student-row">
+                <td>${escape(name)}</td>
+                <td>${escape(course)}</td>
+                <td>${escape(semester)}</td>
+                <td><span class="badge bg-${section.color}">${section.badge}</span></td>
+                <td>${noExam
+                    ? '<span class="badge rounded-pill bg-warning">No Exam Available</span>'
+                    : '<span class="badge bg-danger">Not Assigned</span>'}</td>
+                <td>
+                    <a href="${recordUrl("student.registration", id)}" role="button" class="btn btn-primary btn-sm view-profile-btn" data-student-id="${id}">
+                        <i class="fa fa-user"></i> View Profile
+                    </a>
+                </td>
+            </tr>`);
+        if (!body.length) {
+            return "";
+        }
+        return `
+            <div class="card border-${section.color} mb-3">
+                <div class="card-header bg-${section.color} text-white fw-bold">${section.title}</div>
+                ${renderTable(headers, body)}
+            </div>`;
+    }).join("");
+    return html || renderEmpty("All Students Assigned!");
+}
+
+function renderPager({ page, page_size, total }) {
+    const lastPage = Math.max(Math.ceil(total / page_size), 1);
+    return `
+        <span>Page ${page} / ${lastPage} (${total} students)</span>
+        <a role="button" class="btn btn-light btn-sm dashboard-page-btn ${page <= 1 ? "disabled" : ""}" data-page="${page - 1}">
+            <i class="fa fa-chevron-left"></i>
+        </a>
+        <a role="button" class="btn btn-light btn-sm dashboard-page-btn ${page >= lastPage ? "disabled" : ""}" data-page="${page + 1}">
+            <i class="fa fa-chevron-right"></i>
+        </a>`;
+}
+
 export class ExamDashboardController extends FormController {
     setup() {
         super.setup();
@@ -202,21 +313,76 @@ export class ExamDashboardController extends FormController {
         this.notification = useService("notification");
         this.orm = useService("orm");
 
+        this.dashboardEtag = null;
+
         onMounted(() => {
-            if (this.el) {
+            const root = document.querySelector("#exam-dashboard");
+            if (root) {
                 console.log("Dashboard mounted, setting up event listeners");
 
                 // Handle clicks (but exclude print button to avoid double triggers)
-                this.el.addEventListener("click", this.handleDashboardClick.bind(this));
+                root.addEventListener("click", this.handleDashboardClick.bind(this));
 
                 // Attach search inputs
-                const searchInputs = this.el.querySelectorAll(".dashboard-search");
+                const searchInputs = root.querySelectorAll(".dashboard-search");
                 searchInputs.forEach(input => {
                     input.addEventListener("input", this.handleSearchInput.bind(this));
                 });
             }
         });
-    }        
+
+        // (Re)load the tables on mount and whenever the course filter changes
+        useEffect(
+            (course) => {
+                this.loadDashboardData(course, 1);
+            },
+            () => [this.model.root.data.course_filter || ""]
+        );
+    }
+
+    async loadDashboardData(course, page) {
+        const params = new URLSearchParams({ course: course || "", page });
+        try {
+            // The browser revalidates with If-None-Match and reuses its copy on 304
+            const response = await fetch(`${DASHBOARD_DATA_URL}?${params}`, {
+                credentials: "same-origin",
+                headers: { Accept: "application/json" },
+            });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}`);
+            }
+            const etag = response.headers.get("ETag");
+            if (etag && etag === this.dashboardEtag) {
+                return;
+            }
+            this.dashboardEtag = etag;
+            this.renderDashboardData(await response.json());
+        } catch (error) {
+            console.error("Error loading dashboard data:", error);
+            const errorHtml = '<div class="alert alert-danger">Error loading data</div>';
+            for (const id of ["upcoming-exams-container", "exams-today-container", "unassigned-students-container"]) {
+                const container = document.getElementById(id);
+                if (container) {
+                    container.innerHTML = errorHtml;
+                }
+            }
+        }
+    }
+
+    renderDashboardData(data) {
+        const targets = {
+            "upcoming-exams-container": renderUpcomingExams(data.upcoming),
+            "exams-today-container": renderExamsToday(data.today),
+            "unassigned-students-container": renderUnassignedStudents(data.unassigned.rows),
+            "unassigned-students-pager": renderPager(data.unassigned),
+        };
+        for (const [id, html] of Object.entries(targets)) {
+            const container = document.getElementById(id);
+            if (container) {
+                container.innerHTML = html;
+            }
+        }
+    }
 
     handleDashboardClick(event) {
         // Skip print button clicks (handled by inline onclick)
@@ -256,6 +422,16 @@ export class ExamDashboardController extends FormController {
             return;
         }
 
+        // Unassigned students pager
+        const pageButton = event.target.closest(".dashboard-page-btn");
+        if (pageButton) {
+            event.preventDefault();
+            if (!pageButton.classList.contains("disabled")) {
+                this.loadDashboardData(this.model.root.data.course_filter, parseInt(pageButton.dataset.page));
+            }
+            return;
+        }
+
         // KPI cards
         const kpiCard = event.target.closest(".kpi-card[data-action]");
         if (kpiCard) {
@@ -1,2 +1,3 @@
 from . import exam_assignment_wizard
-from . import exam_seating_wizard
\ No newline at end of file
+from . import exam_seating_wizard
+from . import exam_marks_import_wizard
\ No newline at end of file
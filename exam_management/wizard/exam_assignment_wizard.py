@@ -1,11 +1,20 @@
 from odoo import models, fields, api
 from odoo.exceptions import UserError
-from datetime import date
 
 class ExamAssignmentWizard(models.TransientModel):
     _name = 'exam.assignment.wizard'
     _description = 'Exam Assignment Wizard'
 
+    mode = fields.Selection([
+        ('single', 'Single Exam'),
+        ('bulk', 'Bulk Cohort (Background)'),
+    ], string='Mode', default='single', required=True)
+    exam_ids = fields.Many2many(
+        'exam.planning',
+        string="Exams",
+        help="Each exam is assigned to the students of its own course and semester in a background job"
+    )
+
     class_semester = fields.Selection([
         ('fy_sem1', 'First Year - Semester 1'),
         ('fy_sem2', 'First Year - Semester 2'),
@@ -15,12 +24,11 @@ class ExamAssignmentWizard(models.TransientModel):
         ('ty_sem6', 'Third Year - Semester 6'),
         ('ly_sem7', 'Fourth Year - Semester 7'),
         ('ly_sem8', 'Fourth Year - Semester 8'),
-    ], string='Class & Semester', required=True)
+    ], string='Class & Semester')
     
     exam_id = fields.Many2one(
     'exam.planning',
-    string="Exam",
-    required=True
+    string="Exam"
     )
     # exam_name = fields.Char(string="Exam Name", related="exam_id.exam_planning", store=False, readonly=True)
    
@@ -34,14 +42,20 @@ class ExamAssignmentWizard(models.TransientModel):
         ('EE', 'Electrical'),
         ('BT', 'Biotechnology'),
         ('CH', 'Chemical'),
-    ], string='Course', required=True)
+    ], string='Course')
 
     @api.model
     def default_get(self, fields_list):
         """Set default values if required."""
         res = super(ExamAssignmentWizard, self).default_get(fields_list)
+        active_ids = self.env.context.get('active_ids') or []
         active_id = self.env.context.get('active_id')
-        if active_id:
+        if self.env.context.get('active_model') == 'exam.planning' and len(active_ids) > 1:
+            res.update({
+                'mode': 'bulk',
+                'exam_ids': [(6, 0, active_ids)],
+            })
+        elif active_id:
             exam = self.env['exam.planning'].browse(active_id)
             res.update({
                 'class_semester': exam.class_semester,
@@ -52,6 +66,11 @@ class ExamAssignmentWizard(models.TransientModel):
 
     def assign_exam(self):
         """Assign the clicked exam (with all its subjects) to all matching students."""
+        if self.mode == 'bulk':
+            return self.action_enqueue_bulk()
+        if not (self.exam_id and self.class_semester and self.course):
+            raise UserError("Please select the exam, class/semester and course.")
+
         students = self.env['student.registration'].search([
             ('class_semester', '=', self.class_semester),
             ('course', '=', self.course)
@@ -60,29 +79,9 @@ class ExamAssignmentWizard(models.TransientModel):
         if not students:
             raise UserError("No students found for this Class/Semester and Course.")
 
-        assignment_model = self.env['student.exam.assignment']
-        created_count = 0
+        stats = self.env['student.exam.assignment']._assign_students_to_exam(self.exam_id, students)
 
-        for student in students:
-            for subject in self.exam_id.subject_ids:
-                exists = assignment_model.search([
-                    ('student_id', '=', student.id),
-                    ('exam_id', '=', self.exam_id.id),
-                    ('subject_id', '=', subject.id)
-                ], limit=1)
-
-                if not exists:
-                    assignment_model.create({
-                        'student_id': student.id,
-                        'exam_id': self.exam_id.id,
-                        'subject_id': subject.id,
-                        'class_semester': self.class_semester,
-                        'course': self.course,
-                        'assignment_date': date.today()
-                    })
-                    created_count += 1
-
-        if created_count == 0:
+        if stats['created'] == 0:
             raise UserError("All selected students already have this exam (with subjects) assigned.")
 
         return {
@@ -90,12 +89,33 @@ class ExamAssignmentWizard(models.TransientModel):
             'tag': 'display_notification',
             'params': {
                 'title': 'Exam Assignment Completed',
-                'message': f'{created_count} subject assignments created.',
+                'message': (
+                    f"{stats['created']} subject assignments created, "
+                    f"{stats['skipped']} already existed ({stats['elapsed']:.2f}s)."
+                ),
                 'type': 'success',
                 'sticky': False,
             }
         }
-        
+
+    def action_enqueue_bulk(self):
+        """Queue one background assignment job per selected exam."""
+        if not self.exam_ids:
+            raise UserError("Please select at least one exam to assign.")
+
+        jobs = self.env['exam.assignment.job']._enqueue(self.exam_ids)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Exam Assignment Queued',
+                'message': f'{len(jobs)} assignment jobs queued. Track them under Assignment Jobs.',
+                'type': 'info',
+                'sticky': False,
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
+
     _sql_constraints = [
     ('unique_assignment', 'unique(student_id, exam_id, subject_id)',
      'Student already assigned to this subject in exam!')
@@ -0,0 +1,122 @@
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+import base64
+import csv
+import io
+import logging
+import openpyxl
+
+_logger = logging.getLogger(__name__)
+
+
+class ExamMarksImportWizard(models.TransientModel):
+    _name = 'exam.marks.import.wizard'
+    _description = 'Exam Marks Import Wizard'
+
+    exam_id = fields.Many2one('exam.planning', string="Exam", required=True)
+    file = fields.Binary(string="Marks File", required=True,
+                         help="CSV or XLSX with a header row and the columns: Enrollment ID, Subject, Marks")
+    filename = fields.Char(string="File Name")
+    chunk_size = fields.Integer(string="Chunk Size", default=2000,
+                                help="Number of marks written before the results are recomputed")
+
+    @api.model
+    def default_get(self, fields_list):
+        res = super().default_get(fields_list)
+        if self.env.context.get('active_model') == 'exam.planning' and self.env.context.get('active_id'):
+            res['exam_id'] = self.env.context['active_id']
+        return res
+
+    def _iter_rows(self):
+        """Stream (enrollment_id, subject, marks) rows from the uploaded file, header skipped."""
+        data = io.BytesIO(base64.b64decode(self.file))
+        if (self.filename or '').lower().endswith('.xlsx'):
+            workbook = openpyxl.load_workbook(data, read_only=True, data_only=True)
+            rows = workbook.active.iter_rows(min_row=2, values_only=True)
+        else:
+            rows = csv.reader(io.TextIOWrapper(data, encoding='utf-8-sig'))
+            next(rows, None)
+        for row in rows:
+            if row and any(cell not in (None, '') for cell in row):
+                yield row[:3]
+
+    def _load_result_lines(self):
+        """Result lines of the exam keyed by (enrollment id, subject name)."""
+        exam = self.exam_id
+        results = self.env['exam.result'].search_read([('exam_id', '=', exam.id)], ['student_id'], load=None)
+        students = self.env['student.registration'].search_read(
+            [('id', 'in', [result['student_id'] for result in results])], ['student_id']
+        )
+        enrollment_by_student = {student['id']: student['student_id'] for student in students}
+        enrollment_by_result = {result['id']: enrollment_by_student.get(result['student_id']) for result in results}
+        subject_names = {subject.id: subject.name for subject in exam.subject_ids}
+
+        lines = {}
+        for line in self.env['exam.result.line'].search_read(
+            [('result_id', 'in', list(enrollment_by_result))],
+            ['result_id', 'subject_id', 'attendance', 'total_marks'], load=None
+        ):
+            key = (enrollment_by_result[line['result_id']], subject_names.get(line['subject_id']))
+            lines[key] = line
+        return lines
+
+    def action_import(self):
+        self.ensure_one()
+        lines = self._load_result_lines()
+        if not lines:
+            raise UserError("Generate the results of this exam before importing marks.")
+
+        # Validate every row first so that a bad file writes nothing
+        marks_by_line = {}
+        errors = []
+        for row_no, row in enumerate(self._iter_rows(), start=2):
+            enrollment, subject, marks = (list(row) + [None, None, None])[:3]
+            line = lines.get((str(enrollment or '').strip(), str(subject or '').strip()))
+            if not line:
+                errors.append(f"Row {row_no}: no result line for {enrollment} / {subject}.")
+                continue
+            try:
+                marks = float(marks)
+            except (TypeError, ValueError):
+                errors.append(f"Row {row_no}: invalid marks '{marks}'.")
+                continue
+            if marks < 0 or marks > line['total_marks']:
+                errors.append(f"Row {row_no}: marks {marks} outside 0-{line['total_marks']} for {subject}.")
+            elif line['attendance'] == 'absent' and marks > 0:
+                errors.append(f"Row {row_no}: {enrollment} was absent for {subject}.")
+            else:
+                marks_by_line[line['id']] = marks
+
+        if errors:
+            more = f"\n... and {len(errors) - 50} more errors." if len(errors) > 50 else ""
+            raise UserError("Marks import failed:\n" + "\n".join(errors[:50]) + more)
+
+        # Write chunk by chunk; identical marks share one write and the stored
+        # totals/grades are recomputed once per chunk at flush time.  The
+        # recompute runs in this env too, so the tracked result fields are
+        # not logged per chunk
+        ResultLine = self.env['exam.result.line'].with_context(tracking_disable=True)
+        line_ids = list(marks_by_line)
+        chunk_size = max(self.chunk_size, 1)
+        for start in range(0, len(line_ids), chunk_size):
+            ids_by_marks = {}
+            for line_id in line_ids[start:start + chunk_size]:
+                ids_by_marks.setdefault(marks_by_line[line_id], []).append(line_id)
+            for marks, ids in ids_by_marks.items():
+                ResultLine.browse(ids).write({'marks_obtained': marks})
+            ResultLine.env.flush_all()
+            ResultLine.env.invalidate_all()
+        ResultLine.env['exam.result']._refresh_merit(self.exam_id)
+
+        _logger.info("Imported %s marks for exam %s", len(line_ids), self.exam_id.id)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Marks Imported',
+                'message': f'{len(line_ids)} marks imported.',
+                'type': 'success',
+                'sticky': False,
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
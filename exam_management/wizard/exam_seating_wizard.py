@@ -1,4 +1,6 @@
 from odoo import models, fields, api
+from odoo.exceptions import UserError
+from itertools import zip_longest
 import random
 
 class ExamSeatingWizard(models.TransientModel):
@@ -6,13 +8,23 @@ class ExamSeatingWizard(models.TransientModel):
     _description = 'Exam Seating Wizard'
 
     exam_id = fields.Many2one('exam.planning', string="Exam", readonly=True, tracking=True)
-    hall_id = fields.Many2one('exam.hall', string="Hall", readonly=True, tracking=True)
+    hall_id = fields.Many2one('exam.hall', string="Hall", readonly=True, tracking=True,
+                              help="Leave empty to spread the students over all halls of the exam")
     hall_capacity = fields.Integer(string="Hall Capacity", related="hall_id.capacity", readonly=True, tracking=True)
     student_ids = fields.Many2many('student.registration', string="Assigned Students", readonly=True, tracking=True)
+    interleave_courses = fields.Boolean(string="Interleave Courses",
+                                        help="Alternate courses so that neighbouring seats belong to different courses")
 
     @api.model
     def default_get(self, fields_list):
         res = super().default_get(fields_list)
+        if self._context.get('active_model') == 'exam.planning':
+            exam = self.env['exam.planning'].browse(self._context.get('active_id'))
+            res.update({
+                'exam_id': exam.id,
+                'student_ids': [(6, 0, exam.assignment_ids.mapped('student_id').ids)]
+            })
+            return res
         hall = self.env['exam.hall'].browse(self._context.get('active_id'))
         if hall:
             exam = hall.exam_id
@@ -24,36 +36,66 @@ class ExamSeatingWizard(models.TransientModel):
         return res
 
     def action_generate_seating(self):
-        Seating = self.env['exam.seating']
+        halls = self.hall_id or self.exam_id.hall_ids.sorted(lambda hall: (-hall.capacity, hall.name))
+        if not halls:
+            raise UserError("This exam has no halls to seat students in.")
 
-        # assigned students
-        existing_seats = Seating.search([
-            ('exam_id', '=', self.exam_id.id),
-            ('hall_id', '=', self.hall_id.id)
-        ])
-        already_assigned_students = existing_seats.mapped('student_id')
+        Seating = self.env['exam.seating']
 
-        new_students = self.student_ids - already_assigned_students
+        # Existing seats of the exam in one query
+        seated_students = set()
+        used_seats = {hall.id: set() for hall in halls}
+        for seat in Seating.search_read(
+            [('exam_id', '=', self.exam_id.id)], ['student_id', 'hall_id', 'seat_number'], load=None
+        ):
+            seated_students.add(seat['student_id'])
+            if seat['hall_id'] in used_seats:
+                used_seats[seat['hall_id']].add(seat['seat_number'])
 
+        new_students = self.student_ids.filtered(lambda student: student.id not in seated_students)
         if not new_students:
             return  # already seats exist
 
-        if len(existing_seats) + len(new_students) > self.hall_capacity:
-            raise ValueError("Not enough seats available in this hall")
+        free_seats = sum(max(hall.capacity - len(used_seats[hall.id]), 0) for hall in halls)
+        if len(new_students) > free_seats:
+            raise UserError(
+                f"Not enough seats available: {len(new_students)} students to seat, {free_seats} free seats."
+            )
+
+        students = self._order_students(new_students)
 
-        # seat number allocation (next available seat)
-        used_seats = set(existing_seats.mapped('seat_number'))
-        seat_no = 1
-        for student in new_students:
-            while seat_no in used_seats:
+        # Fill halls one after another, taking the next free seat numbers
+        vals_list = []
+        position = 0
+        for hall in halls:
+            seat_no = 1
+            free = max(hall.capacity - len(used_seats[hall.id]), 0)
+            for student in students[position:position + free]:
+                while seat_no in used_seats[hall.id]:
+                    seat_no += 1
+                vals_list.append({
+                    'exam_id': self.exam_id.id,
+                    'hall_id': hall.id,
+                    'student_id': student.id,
+                    'seat_number': seat_no,
+                    'course': student.course,
+                })
                 seat_no += 1
+            position += free
+            if position >= len(students):
+                break
 
-            Seating.create({
-                'exam_id': self.exam_id.id,
-                'hall_id': self.hall_id.id,
-                'student_id': student.id,
-                'seat_number': seat_no,
-            })
+        Seating.with_context(tracking_disable=True).create(vals_list)
+
+    def _order_students(self, students):
+        """Seating order; with ``interleave_courses`` the courses take turns
+        (largest course first) so that neighbours differ where possible."""
+        students = students.sorted('id')
+        if not self.interleave_courses:
+            return list(students)
 
-            used_seats.add(seat_no)
-            seat_no += 1
+        by_course = {}
+        for student in students:
+            by_course.setdefault(student.course, []).append(student)
+        groups = sorted(by_course.values(), key=len, reverse=True)
+        return [student for turn in zip_longest(*groups) for student in turn if student]
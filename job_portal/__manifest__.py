@@ -6,7 +6,7 @@
     'description': """Through this module you can manage job portal and job applications easily.""",
     'category': 'Human Resources/Employees',
     'website': 'https://www.odoo.com',
-    'depends': ['base', 'mail', 'web', 'portal', 'website'],
+    'depends': ['base', 'mail', 'web', 'portal', 'website', 'bulk_export'],
     'data': [
         'data/welcome_mail_template.xml',
         'data/shortlisted_mail_template.xml',
@@ -1,9 +1,5 @@
 from odoo import models, fields, api
 from datetime import datetime, timedelta
-import io
-import json
-import base64
-import xlsxwriter
 
 class JobApplication(models.Model):
     _name = 'job.application'
@@ -109,106 +105,21 @@ class JobApplication(models.Model):
 
         return res   
     
-    def action_export_excel(self):
-        """Export the current job application record to Excel (row-wise table)"""
-        self.ensure_one()
-        output = io.BytesIO()
-        workbook = xlsxwriter.Workbook(output, {'in_memory': True})
-        sheet = workbook.add_worksheet('Job Application')
-
-        # Define formats
-        header_format = workbook.add_format({
-            'bold': True,
-            'bg_color': '#D3D3D3',
-            'border': 1,
-            'align': 'center',
-            'valign': 'vcenter'
-        })
-        text_format = workbook.add_format({'border': 1})
-
-        # Data mapping (field order matters here)
-        headers = [
-            'Applicant Name', 'Email', 'Phone',
-            'Applied Job', 'CV Filename', 'Status', 'Active'
-        ]
-        values = [
-            self.applicant_name or '',
-            self.email or '',
-            self.phone or '',
-            self.job_id.name or '',
-            self.cv_filename or '',
-            self.status or '',
-            'Yes' if self.active else 'No'
-        ]
-
-        # Write headers in row 0
-        for col, header in enumerate(headers):
-            sheet.write(0, col, header, header_format)
-
-        # Write values in row 1
-        for col, value in enumerate(values):
-            sheet.write(1, col, value, text_format)
-
-        # Auto adjust column widths based on header length
-        for col, header in enumerate(headers):
-            column_width = max(len(str(header)), len(str(values[col]))) + 5
-            sheet.set_column(col, col, column_width)
+    # Columns of the application export: (field name, header)
+    _export_field_spec = [
+        ('applicant_name', 'Applicant Name'),
+        ('email', 'Email'),
+        ('phone', 'Phone'),
+        ('job_id', 'Applied Job'),
+        ('cv_filename', 'CV Filename'),
+        ('status', 'Status'),
+        ('active', 'Active'),
+    ]
 
-        workbook.close()
-        output.seek(0)
-        excel_data = output.read()
-        output.close()
-
-        # Create attachment
-        attachment = self.env['ir.attachment'].create({
-            'name': f'{self.applicant_name}_application.xlsx',
-            'type': 'binary',
-            'datas': base64.b64encode(excel_data),
-            'res_model': 'job.application',
-            'res_id': self.id,
-            'mimetype': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
-        })
+    def action_export_excel(self):
+        """Export the selected job applications to Excel"""
+        return self.env['bulk.export.job']._start(self, self._export_field_spec, 'xlsx', 'Job_Applications')
 
-        # Return as downloadable file
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'new',
-        }
     def action_export_json(self):
-        """Export the current job application record to JSON"""
-        self.ensure_one()
-
-        # Prepare data as a dict
-        data = {
-            'applicant_name': self.applicant_name or '',
-            'email': self.email or '',
-            'phone': self.phone or '',
-            'applied_job': self.job_id.name or '',
-            'cv_filename': self.cv_filename or '',
-            'status': self.status or '',
-            'active': True if self.active else False,
-        }
-
-        # Convert to JSON string (pretty-printed)
-        json_data = json.dumps(data, indent=4)
-
-        # Encode JSON as binary for attachment
-        json_bytes = json_data.encode("utf-8")
-        attachment = self.env['ir.attachment'].create({
-            'name': f'{self.applicant_name}_application.json',
-            'type': 'binary',
-            'datas': base64.b64encode(json_bytes),
-            'res_model': 'job.application',
-            'res_id': self.id,
-            'mimetype': 'application/json'
-        })
-
-        # Return as downloadable file
-        return {
-            'type': 'ir.actions.act_url',
-            'url': f'/web/content/{attachment.id}?download=true',
-            'target': 'new',
-        }    
-       
-   
\ No newline at end of file
+        """Export the selected job applications as JSON Lines (one object per application)"""
+        return self.env['bulk.export.job']._start(self, self._export_field_spec, 'jsonl', 'Job_Applications')